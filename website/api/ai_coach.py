@@ -22,8 +22,6 @@ from ..models.health import HealthMetric
 from ..models.nutrition import MealLog, MealType
 from ..models.workout import WorkoutSession, ExerciseLog, SessionType
 from ..models.coaching import CoachingSession
-from ..services.gemini_service import GeminiService, QuotaExhaustedError
-from ..utils.ai_coach_tools import get_all_function_declarations
 from . import (
     success_response,
     error_response,
@@ -73,6 +71,11 @@ def send_message():
             }
         }
     """
+    # Imported here rather than at module level: google.genai takes about
+    # half a second to import, and only this endpoint needs it
+    from ..services.gemini_service import GeminiService, QuotaExhaustedError
+    from ..utils.ai_coach_tools import get_all_function_declarations
+
     try:
         # Validate request
         is_valid, data_or_errors = validate_request_data(
@@ -128,9 +131,12 @@ def send_message():
             function_decls = get_all_function_declarations()
             logger.info(f"Function declarations count: {len(function_decls) if function_decls else 0}")
 
+            # Convert history once; the data-informed follow-up below reuses it
+            history_contents = gemini.ingest_history(conversation.messages[-15:])
+
             assistant_response, function_call = gemini.chat(
                 user_message=user_message,
-                conversation_history=conversation.messages,
+                conversation_history=history_contents,
                 function_declarations=function_decls,
                 max_context_messages=10
             )
@@ -229,9 +235,10 @@ def send_message():
 
                     # Get AI's final response with data context
                     try:
+                        history_contents += gemini.ingest_history(conversation.messages[-1:])
                         assistant_response, _ = gemini.chat(
                             user_message="Based on the data provided above, please give your coaching response.",
-                            conversation_history=conversation.messages,
+                            conversation_history=history_contents,
                             function_declarations=None,  # No more function calling in this turn
                             max_context_messages=15  # Include more context for data-informed response
                         )
@@ -5,6 +5,7 @@ Debug API Endpoint
 Temporary debugging endpoint to diagnose GeminiService issues.
 """
 
+import json
 import logging
 import os
 import traceback
@@ -167,6 +168,10 @@ def test_gemini_chat_with_functions():
         try:
             function_decls = get_all_function_declarations()
             debug_info['function_declarations_count'] = len(function_decls) if function_decls else 0
+            # default=dict unwraps the read-only MappingProxyType schemas
+            debug_info['function_declarations_json_bytes'] = len(json.dumps(
+                function_decls, default=dict, separators=(',', ':')
+            ).encode('utf-8'))
             debug_info['function_declarations_loaded'] = True
         except Exception as e:
             debug_info['function_declarations_loaded'] = False
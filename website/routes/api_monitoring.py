@@ -22,7 +22,7 @@ def health_check():
         return jsonify({
             'status': 'healthy',
             'memory_mb': memory.rss / 1024 / 1024,
-            'cpu_percent': psutil.cpu_percent(interval=0.1)
+            'cpu_percent': get_performance_monitor().get_cpu_usage()
         })
     except (OSError, psutil.Error) as e:
         from flask import current_app
@@ -41,15 +41,16 @@ def get_metrics():
     monitor = get_performance_monitor()
     cache = get_cache()
     cache_stats = get_cache_stats()
+    performance = monitor.get_system_metrics()
 
     return jsonify({
-        'performance': monitor.get_system_metrics(),
+        'performance': performance,
         'cache': {
             'stats': cache.get_stats(),
             'cache_stats': cache_stats.get_stats()
         },
         'system': {
-            'cpu_percent': psutil.cpu_percent(interval=0.1),
+            'cpu_percent': performance['cpu'],
             'memory_percent': psutil.virtual_memory().percent
         }
     })
@@ -91,15 +92,16 @@ def get_full_metrics():
     monitor = get_performance_monitor()
     cache = get_cache()
     cache_stats = get_cache_stats()
+    report = monitor.get_full_report()
 
     return jsonify({
-        'performance': monitor.get_full_report(),
+        'performance': report,
         'cache': {
             'data': cache.get_stats(),
             'stats': cache_stats.get_stats()
         },
         'system': {
-            'cpu_percent': psutil.cpu_percent(interval=0.1),
+            'cpu_percent': report['system_metrics']['cpu'],
             'virtual_memory': dict(psutil.virtual_memory()._asdict()),
             'disk_usage': dict(psutil.disk_usage('/')._asdict())
         }
@@ -285,20 +285,15 @@ def get_categorized_files(project_name):
 
         scan_path = docs_path if os.path.isdir(docs_path) else project_path
 
-        files_with_content = []
+        relative_paths = []
 
         for root, _, files in os.walk(scan_path):
             for file in files:
                 if file.endswith('.md') and not file.startswith('_'):
                     file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, scan_path)
-
-                    try:
-                        with open(file_path, 'r') as f:
-                            content = f.read(2000)
-                        files_with_content.append((relative_path, content))
-                    except Exception:
-                        files_with_content.append((relative_path, ''))
+                    relative_paths.append(os.path.relpath(file_path, scan_path))
+
+        files_with_content = FileCategorizer.read_excerpts(scan_path, relative_paths)
 
         # Add virtual database-driven pages if user is authenticated
         if current_user.is_authenticated and project_name in ProjectFileManager.VIRTUAL_PAGES:
@@ -10,7 +10,19 @@ Services:
 - quota_manager: Singleton instance for tracking quota state
 """
 
-from .gemini_service import GeminiService, QuotaExhaustedError
+from ..utils.lazy import lazy_attributes
+
 from .quota_manager import quota_manager
 
+# Public name -> submodule that defines it. These are imported on first
+# attribute access (PEP 562), so importing the package (or quota_manager)
+# doesn't also load the google.genai SDK behind gemini_service.
+_LAZY_ATTRS = {
+    'GeminiService': 'gemini_service',
+    'QuotaExhaustedError': 'gemini_service',
+}
+
 __all__ = ['GeminiService', 'QuotaExhaustedError', 'quota_manager']
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRS)
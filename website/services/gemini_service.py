@@ -10,7 +10,13 @@ Migrated to google.genai SDK (January 2026)
 
 import os
 import re
+import random
 import logging
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Tuple, Optional, Any
 from google import genai
 from google.genai import types
@@ -26,6 +32,75 @@ except ImportError:
     quota_manager = None
 
 
+# Shared genai clients keyed by API key. GeminiService is constructed per
+# request, so reusing the client keeps its HTTP connection pool warm across
+# requests and fallback models instead of paying a new TLS handshake each time.
+_clients: Dict[str, 'genai.Client'] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(api_key: str) -> 'genai.Client':
+    """Return the process-wide genai.Client for api_key, creating it once."""
+    client = _clients.get(api_key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = genai.Client(api_key=api_key)
+                _clients[api_key] = client
+    return client
+
+
+# Harm categories blocked at medium severity and above
+_SAFETY_CATEGORIES = (
+    'HARM_CATEGORY_HARASSMENT',
+    'HARM_CATEGORY_HATE_SPEECH',
+    'HARM_CATEGORY_SEXUALLY_EXPLICIT',
+    'HARM_CATEGORY_DANGEROUS_CONTENT',
+)
+
+# Conversation role -> SDK role. Anything else ('user', 'system' data
+# results) is sent as 'user'.
+_SDK_ROLES = {'assistant': 'model'}
+
+# Server retry hints in error text: protobuf "retry_delay { seconds: 51 }",
+# JSON "'retryDelay': '51s'" and HTTP "Retry-After: 51"
+_RETRY_DELAY_RE = re.compile(
+    r'retry_?delay\W*(?:\{\s*seconds\W*)?(\d+)|retry-after\W*(\d+)',
+    re.IGNORECASE
+)
+
+# Bounds (seconds) for how long a rate-limited model is skipped, and the
+# wait used when the error carries no hint at all
+_MIN_RETRY_DELAY = 1
+_MAX_RETRY_DELAY = 900
+_DEFAULT_RETRY_DELAY = 60
+
+# Transient server errors (5xx) are retried on the same model with capped
+# exponential backoff and jitter, within an overall deadline so a request
+# never holds the HTTP worker for long. Quota errors use the fallback chain.
+_TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+_TRANSIENT_ERROR_RE = re.compile(r'\b50[0234]\b|UNAVAILABLE|DEADLINE_EXCEEDED|INTERNAL')
+_TRANSIENT_MAX_ATTEMPTS = 3
+_TRANSIENT_BASE_DELAY = 1.0
+_TRANSIENT_MAX_DELAY = 8.0
+_TRANSIENT_DEADLINE = 30.0
+
+
+@lru_cache(maxsize=128)
+def _parse_retry_delay_text(text: str) -> Optional[int]:
+    """
+    Parse a retry hint from error text.
+
+    Cached by message: during a rate-limit burst the same error text comes
+    back on every attempt and from every concurrent request.
+    """
+    match = _RETRY_DELAY_RE.search(text)
+    if match:
+        return int(match.group(1) or match.group(2))
+    return None
+
+
 # Custom Exceptions
 class QuotaExhaustedError(Exception):
     """
@@ -126,42 +201,50 @@ class GeminiService:
     - Error handling and safety settings
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Used when GEMINI_MODEL_FALLBACK_CHAIN isn't configured or there is no app context
+    DEFAULT_MODEL_NAMES = (
+        'gemini-1.5-flash',  # Use 1.5-flash first - better function calling support
+        'gemini-1.5-flash-8b',
+        'gemini-2.0-flash-exp',
+        'gemini-2.5-flash'  # 2.5 has code execution which interferes with function calling
+    )
+
+    def __init__(self, api_key: Optional[str] = None, model_names: Optional[List[str]] = None):
         """
         Initialize Gemini service with model fallback chain.
 
         Args:
             api_key: Google Gemini API key (defaults to GEMINI_API_KEY env var)
+            model_names: Model fallback chain (defaults to GEMINI_MODEL_FALLBACK_CHAIN config)
 
         Raises:
             ValueError: If API key is not provided or found in environment
         """
         # Debug logging
-        logger.info(f"GeminiService.__init__ called with api_key parameter: {bool(api_key)}")
+        logger.info("GeminiService.__init__ called with api_key parameter: %s", bool(api_key))
         env_key = os.environ.get('GEMINI_API_KEY')
-        logger.info(f"GEMINI_API_KEY from environment: {bool(env_key)}")
+        logger.info("GEMINI_API_KEY from environment: %s", bool(env_key))
 
         self.api_key = api_key or env_key
 
         if not self.api_key:
             logger.error("GEMINI_API_KEY not found in parameters or environment")
-            logger.error(f"Environment keys available: {', '.join([k for k in os.environ.keys() if 'GEMINI' in k or 'API' in k])}")
+            logger.error(
+                "Environment keys available: %s",
+                ', '.join([k for k in os.environ.keys() if 'GEMINI' in k or 'API' in k])
+            )
             raise ValueError(
                 "GEMINI_API_KEY not found. Please set it in your environment or pass it to GeminiService."
             )
 
-        # Initialize the Gemini client
-        self.client = genai.Client(api_key=self.api_key)
+        # Reuse the shared Gemini client (and its connection pool)
+        self.client = _get_client(self.api_key)
 
         # Load model fallback chain from config
         try:
             from flask import current_app
-            self.model_names = current_app.config.get('GEMINI_MODEL_FALLBACK_CHAIN', [
-                'gemini-1.5-flash',  # Use 1.5-flash first - better function calling support
-                'gemini-1.5-flash-8b',
-                'gemini-2.0-flash-exp',
-                'gemini-2.5-flash'  # 2.5 has code execution which interferes with function calling
-            ])
+            if model_names is None:
+                model_names = current_app.config.get('GEMINI_MODEL_FALLBACK_CHAIN', self.DEFAULT_MODEL_NAMES)
 
             self.generation_config = current_app.config.get('GEMINI_GENERATION_CONFIG', {
                 'temperature': 0.7,
@@ -171,12 +254,8 @@ class GeminiService:
             })
         except RuntimeError:
             # Working outside Flask application context (testing)
-            self.model_names = [
-                'gemini-1.5-flash',  # Use 1.5-flash first - better function calling support
-                'gemini-1.5-flash-8b',
-                'gemini-2.0-flash-exp',
-                'gemini-2.5-flash'  # 2.5 has code execution which interferes with function calling
-            ]
+            if model_names is None:
+                model_names = self.DEFAULT_MODEL_NAMES
             self.generation_config = {
                 'temperature': 0.7,
                 'top_p': 0.95,
@@ -184,6 +263,8 @@ class GeminiService:
                 'max_output_tokens': 2048,
             }
 
+        self.model_names = list(model_names)
+
         # Set quota manager (may be None if import failed)
         self.quota_manager = quota_manager
         if not self.quota_manager:
@@ -191,7 +272,16 @@ class GeminiService:
 
         self.system_prompt = TRANSFORMATIVE_TRAINER_PERSONA
 
-        logger.info(f"GeminiService initialized with {len(self.model_names)} fallback models")
+        # Static portion of every request config, resolved once per instance
+        self._config_params = {
+            'temperature': self.generation_config.get('temperature', 0.7),
+            'top_p': self.generation_config.get('top_p', 0.95),
+            'top_k': self.generation_config.get('top_k', 40),
+            'max_output_tokens': self.generation_config.get('max_output_tokens', 2048),
+        }
+        self._safety_settings: Optional[List[types.SafetySetting]] = None
+
+        logger.info("GeminiService initialized with %d fallback models", len(self.model_names))
 
     def chat(
         self,
@@ -208,7 +298,8 @@ class GeminiService:
 
         Args:
             user_message: The user's message
-            conversation_history: List of previous messages with 'role' and 'content' keys
+            conversation_history: List of previous messages with 'role' and 'content' keys,
+                or Content objects from ingest_history()
             function_declarations: List of function schemas for function calling
             max_context_messages: Maximum number of previous messages to include (default: 10)
 
@@ -225,71 +316,149 @@ class GeminiService:
         recent_history = conversation_history[-max_context_messages:] if conversation_history else []
         history = self._build_history(recent_history)
 
+        # Only consult per-model quota state when some model is exhausted
+        check_quota = bool(self.quota_manager) and self.quota_manager.has_exhausted_models
+        if check_quota:
+            is_quota_available = self.quota_manager.is_quota_available
+
         # Try each model in fallback chain
         for model_name in self.model_names:
-            # Check quota if manager is available
-            if self.quota_manager and not self.quota_manager.is_quota_available(model_name):
-                logger.info(f"Skipping {model_name} - quota exhausted")
+            # Check quota if manager is available. Each check reads the clock
+            # itself, since retries on earlier models can take long enough for
+            # a later model's quota to reset.
+            if check_quota and not is_quota_available(model_name):
+                logger.info("Skipping %s - quota exhausted", model_name)
                 continue
 
             try:
-                logger.info(f"Attempting with {model_name}")
-
-                # Build generation config
-                config = types.GenerateContentConfig(
-                    system_instruction=self._get_contextualized_system_instruction(),
-                    temperature=self.generation_config.get('temperature', 0.7),
-                    top_p=self.generation_config.get('top_p', 0.95),
-                    top_k=self.generation_config.get('top_k', 40),
-                    max_output_tokens=self.generation_config.get('max_output_tokens', 2048),
-                    safety_settings=self._get_safety_settings(),
-                    # CRITICAL: Disable automatic function calling to preserve manual handling
-                    automatic_function_calling=types.AutomaticFunctionCallingConfig(
-                        disable=True
-                    )
-                )
-
-                # Add function declarations and tool config if provided
-                if function_declarations:
-                    # Wrap function declarations in Tool object
-                    config.tools = [types.Tool(function_declarations=function_declarations)]
-                    config.tool_config = types.ToolConfig(
-                        function_calling_config=types.FunctionCallingConfig(mode='AUTO')
-                    )
+                logger.info("Attempting with %s", model_name)
 
                 # Create chat with history
                 chat = self.client.chats.create(
                     model=model_name,
-                    config=config,
+                    config=self._build_config(function_declarations),
                     history=history
                 )
 
-                # Send message
-                response = chat.send_message(message=user_message)
+                # Send message (retrying transient server errors)
+                response = self._send_message(chat, user_message)
 
                 # Extract response
                 assistant_response, function_call = self._extract_response(response)
 
-                logger.info(f"Success with {model_name}")
+                logger.info("Success with %s", model_name)
                 return assistant_response, function_call
 
             except Exception as e:
-                # Check if quota error
-                if self._is_quota_error(e):
-                    retry_delay = self._extract_retry_delay(e)
-                    logger.warning(f"{model_name} quota exhausted, retry in {retry_delay}s")
+                self._handle_model_error(model_name, e)
 
-                    # Mark quota exhausted if manager available
-                    if self.quota_manager:
-                        self.quota_manager.mark_quota_exhausted(model_name, retry_delay)
+        # All models exhausted
+        self._raise_quota_exhausted()
 
-                    continue  # Try next model
+    def _build_config(self, function_declarations: Optional[List[Dict]] = None) -> types.GenerateContentConfig:
+        """
+        Build the per-request generation config.
 
-                # Non-quota error - propagate
-                logger.error(f"Non-quota error with {model_name}: {e}", exc_info=True)
-                raise
+        Args:
+            function_declarations: List of function schemas for function calling
 
-        # All models exhausted
+        Returns:
+            GenerateContentConfig for client.chats.create()
+        """
+        config = types.GenerateContentConfig(
+            system_instruction=self._get_contextualized_system_instruction(),
+            **self._config_params,
+            safety_settings=self._get_safety_settings(),
+            # CRITICAL: Disable automatic function calling to preserve manual handling
+            automatic_function_calling=types.AutomaticFunctionCallingConfig(
+                disable=True
+            )
+        )
+
+        # Add function declarations and tool config if provided
+        if function_declarations:
+            # Wrap function declarations in Tool object
+            config.tools = [types.Tool(function_declarations=function_declarations)]
+            config.tool_config = types.ToolConfig(
+                function_calling_config=types.FunctionCallingConfig(mode='AUTO')
+            )
+
+        return config
+
+    def _send_message(self, chat, user_message: str):
+        """Send a message, retrying transient server errors with backoff."""
+        deadline = time.monotonic() + _TRANSIENT_DEADLINE
+        attempt = 0
+        while True:
+            try:
+                return chat.send_message(message=user_message)
+            except Exception as e:
+                delay = self._transient_retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _transient_retry_delay(self, exception: Exception, attempt: int, deadline: float) -> Optional[float]:
+        """
+        Decide whether to retry a failed send and how long to wait first.
+
+        Backoff is min(8s, 1s * 2**attempt) scaled by a random 0.5-1.0 jitter,
+        raised to the server's retry hint when that is longer.
+
+        Returns:
+            Seconds to sleep before the next attempt, or None to give up
+            (not a transient error, attempts used up, or past the deadline)
+        """
+        if attempt + 1 >= _TRANSIENT_MAX_ATTEMPTS or not self._is_transient_error(exception):
+            return None
+
+        delay = min(_TRANSIENT_MAX_DELAY, _TRANSIENT_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+        hint = self._parse_retry_hint(exception)
+        if hint is not None:
+            delay = max(delay, hint)
+
+        if time.monotonic() + delay > deadline:
+            return None
+
+        logger.warning(
+            "Transient error (attempt %d/%d), retrying in %.1fs: %s",
+            attempt + 1, _TRANSIENT_MAX_ATTEMPTS, delay, exception
+        )
+        return delay
+
+    def _is_transient_error(self, exception: Exception) -> bool:
+        """Check if exception is a retryable server error (5xx, unavailable, deadline)."""
+        if self._is_quota_error(exception):
+            return False
+        code = getattr(exception, 'code', None)
+        if isinstance(code, int):
+            return code in _TRANSIENT_STATUS_CODES
+        return _TRANSIENT_ERROR_RE.search(str(exception)) is not None
+
+    def _handle_model_error(self, model_name: str, exception: Exception):
+        """
+        Handle an error from a single model attempt in the fallback chain.
+
+        Quota errors mark the model exhausted and return so the caller can
+        try the next model. Any other error is re-raised.
+        """
+        # Check if quota error
+        if self._is_quota_error(exception):
+            retry_delay = self._extract_retry_delay(exception)
+            logger.warning("%s quota exhausted, retry in %ss", model_name, retry_delay)
+
+            # Mark quota exhausted if manager available
+            if self.quota_manager:
+                self.quota_manager.mark_quota_exhausted(model_name, retry_delay)
+            return
+
+        # Non-quota error - propagate
+        logger.error("Non-quota error with %s: %s", model_name, exception, exc_info=True)
+        raise exception
+
+    def _raise_quota_exhausted(self):
+        """Raise QuotaExhaustedError once every model in the chain has been tried."""
         seconds_until_reset = self.quota_manager.get_seconds_until_reset() if self.quota_manager else None
         raise QuotaExhaustedError(
             "All AI models have reached their quota limits.",
@@ -347,42 +516,58 @@ class GeminiService:
 
     def _extract_retry_delay(self, exception: Exception) -> int:
         """
-        Extract retry_delay from quota error.
+        Extract the server's retry delay from a quota error.
+
+        Uses _parse_retry_hint() and clamps the result to 1-900 seconds.
 
         Returns:
-            Retry delay in seconds (default 3600 = 1 hour if not found)
+            Retry delay in seconds (default 60 if not found)
         """
-        error_str = str(exception)
+        delay = self._parse_retry_hint(exception)
+        if delay is None:
+            logger.warning("Could not parse retry delay, defaulting to %ds", _DEFAULT_RETRY_DELAY)
+            return _DEFAULT_RETRY_DELAY
 
-        # Look for "retry_delay { seconds: 51 }" pattern
-        match = re.search(r'retry_delay.*?seconds[:\s]+(\d+)', error_str)
-        if match:
-            return int(match.group(1))
+        return min(max(delay, _MIN_RETRY_DELAY), _MAX_RETRY_DELAY)
+
+    def _parse_retry_hint(self, exception: Exception) -> Optional[int]:
+        """
+        Read the server's retry hint from an error, if it has one.
 
-        # Default to 1 hour if not specified
-        logger.warning("Could not parse retry_delay, defaulting to 3600s")
-        return 3600
+        Prefers a Retry-After header on the error's HTTP response (seconds or
+        an HTTP date), then a retry hint in the error text.
+
+        Returns:
+            Unclamped delay in seconds, or None if the error carries no hint
+        """
+        headers = getattr(getattr(exception, 'response', None), 'headers', None)
+        retry_after = headers.get('retry-after') if headers else None
+        if retry_after:
+            retry_after = retry_after.strip()
+            if retry_after.isdigit():
+                return int(retry_after)
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None and retry_at.tzinfo is not None:
+                return int((retry_at - datetime.now(timezone.utc)).total_seconds())
+
+        return _parse_retry_delay_text(str(exception))
 
     def _get_safety_settings(self) -> List[types.SafetySetting]:
-        """Get safety settings as list of SafetySetting objects."""
-        return [
-            types.SafetySetting(
-                category='HARM_CATEGORY_HARASSMENT',
-                threshold='BLOCK_MEDIUM_AND_ABOVE'
-            ),
-            types.SafetySetting(
-                category='HARM_CATEGORY_HATE_SPEECH',
-                threshold='BLOCK_MEDIUM_AND_ABOVE'
-            ),
-            types.SafetySetting(
-                category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
-                threshold='BLOCK_MEDIUM_AND_ABOVE'
-            ),
-            types.SafetySetting(
-                category='HARM_CATEGORY_DANGEROUS_CONTENT',
-                threshold='BLOCK_MEDIUM_AND_ABOVE'
-            )
-        ]
+        """
+        Get safety settings as list of SafetySetting objects.
+
+        Built on first use and reused for every fallback attempt made by
+        this instance.
+        """
+        if self._safety_settings is None:
+            self._safety_settings = [
+                types.SafetySetting(category=category, threshold='BLOCK_MEDIUM_AND_ABOVE')
+                for category in _SAFETY_CATEGORIES
+            ]
+        return self._safety_settings
 
     def _get_contextualized_system_instruction(self) -> str:
         """
@@ -391,10 +576,9 @@ class GeminiService:
         Returns:
             System instruction string with current date
         """
-        from datetime import datetime
-
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        day_of_week = datetime.now().strftime('%A')
+        now = datetime.now()
+        current_date = now.strftime('%Y-%m-%d')
+        day_of_week = now.strftime('%A')
 
         return f"""CURRENT DATE: {current_date} ({day_of_week})
 
@@ -402,28 +586,42 @@ class GeminiService:
 
 IMPORTANT: When users say "today", use the date {current_date}. When creating records, ALWAYS include the appropriate date field (recorded_date, meal_date, session_date, etc.) with the correct date value in YYYY-MM-DD format."""
 
-    def _build_history(self, history: List[Dict]) -> List[types.Content]:
+    def ingest_history(self, history: List[Dict]) -> List[types.Content]:
         """
-        Build chat history as list of Content objects.
+        Convert conversation messages to SDK Content objects up front.
+
+        The result can be passed as conversation_history to chat(), and
+        extended with further ingested messages, so a caller making several
+        calls over the same conversation converts each message only once.
 
         Args:
             history: List of message dicts with 'role' and 'content' keys
 
         Returns:
-            List of types.Content objects for chat history
+            List of types.Content objects
         """
-        contents = []
-
-        for msg in history:
-            role = 'model' if msg['role'] == 'assistant' else 'user'
-            contents.append(
-                types.Content(
-                    role=role,
-                    parts=[types.Part(text=msg['content'])]
-                )
-            )
+        return self._build_history(history)
 
-        return contents
+    def _build_history(self, history: List[Any]) -> List[types.Content]:
+        """
+        Build chat history as list of Content objects.
+
+        Args:
+            history: List of message dicts with 'role' and 'content' keys.
+                Entries already converted by ingest_history() are passed
+                through unchanged.
+
+        Returns:
+            List of types.Content objects for chat history
+        """
+        get_role = _SDK_ROLES.get
+        return [
+            types.Content(
+                role=get_role(msg['role'], 'user'),
+                parts=[types.Part(text=msg['content'])]
+            ) if isinstance(msg, dict) else msg
+            for msg in history
+        ]
 
     def _extract_response(self, response) -> Tuple[str, Optional[Dict]]:
         """Extract text and function call(s) from API response.
@@ -436,12 +634,14 @@ IMPORTANT: When users say "today", use the date {current_date}. When creating re
 
         function_calls = []
         if hasattr(response, 'function_calls') and response.function_calls:
+            log_calls = logger.isEnabledFor(logging.INFO)
             for fc in response.function_calls:
                 function_calls.append({
                     'name': fc.name,
                     'args': dict(fc.args) if fc.args else {}
                 })
-                logger.info(f"Function call detected: {fc.name}")
+                if log_calls:
+                    logger.info("Function call detected: %s", fc.name)
 
         # Handle function calls
         function_call = None
@@ -455,7 +655,7 @@ IMPORTANT: When users say "today", use the date {current_date}. When creating re
                     'name': 'multiple_function_calls',
                     'function_calls': function_calls
                 }
-                logger.info(f"Multiple function calls detected: {len(function_calls)}")
+                logger.info("Multiple function calls detected: %d", len(function_calls))
 
         # Provide default message if no text but function call present
         if not assistant_response and function_call:
@@ -465,7 +665,7 @@ IMPORTANT: When users say "today", use the date {current_date}. When creating re
             else:
                 assistant_response = self._get_default_function_call_message(function_call['name'])
 
-        logger.info(f"Gemini response received. Function calls: {len(function_calls)}")
+        logger.info("Gemini response received. Function calls: %d", len(function_calls))
         return assistant_response, function_call
 
     @staticmethod
@@ -488,7 +688,7 @@ IMPORTANT: When users say "today", use the date {current_date}. When creating re
             )
             return True
         except Exception as e:
-            logger.error(f"API key validation failed: {str(e)}")
+            logger.error("API key validation failed: %s", e)
             return False
 
     @property
@@ -9,22 +9,75 @@ expiration based on retry_delay from API errors. Thread-safe for use
 in Flask's multi-threaded environment.
 """
 
+import heapq
 import logging
 import threading
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+import time
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
+# Offset between the wall clock and time.monotonic(), cached for at most
+# _WALL_OFFSET_TTL seconds. Reset times are reported at second resolution,
+# so concurrent status calls can share one time.time() read.
+_WALL_OFFSET_TTL = 1.0
+_wall_offset_cache = (float('-inf'), 0.0)  # (monotonic time computed, offset)
+
+
+def _wall_offset(now: Optional[float] = None) -> float:
+    """
+    Get time.time() - time.monotonic(), refreshing the cached value when stale.
+
+    Args:
+        now: Current time.monotonic() reading, if the caller already has one
+    """
+    global _wall_offset_cache
+
+    if now is None:
+        now = time.monotonic()
+
+    computed_at, offset = _wall_offset_cache
+    if now - computed_at > _WALL_OFFSET_TTL:
+        offset = time.time() - now
+        # Single tuple assignment, so readers never see a torn pair
+        _wall_offset_cache = (now, offset)
+
+    return offset
+
+
+# Shortest sleep between sweeps, so a burst of near-simultaneous resets is
+# handled in one pass
+_SWEEP_MIN_INTERVAL = 1.0
+
+
+class _QuotaEntry:
+    """
+    Reset time for one exhausted model, precomputed in every needed form.
+
+    Uses __slots__ so entries carry no per-instance __dict__.
+    """
+
+    __slots__ = ('reset_mono', 'reset_time', 'reset_iso')
+
+    def __init__(self, reset_mono: float, reset_time: datetime, reset_iso: str):
+        self.reset_mono = reset_mono    # time.monotonic() deadline used for expiry checks
+        self.reset_time = reset_time    # wall-clock UTC reset time
+        self.reset_iso = reset_iso      # reset_time as reported by get_status()
+
 
 class QuotaManager:
     """
     Tracks quota exhaustion state for Gemini models.
 
     When a model quota is exhausted, stores the reset time based on
-    retry_delay from API error. Automatically expires when time passes.
+    retry_delay from API error. Automatically expires when time passes:
+    readers treat past-due entries as available, and a background sweeper
+    thread removes them once their reset time is reached.
 
-    Thread-safe for use in Flask (multi-threaded environment).
+    Thread-safe for use in Flask (multi-threaded environment). Reads never
+    take the lock; it only serializes marking, sweeping and heap access,
+    so a single lock is not a contention point.
 
     Example:
         >>> manager = QuotaManager()
@@ -37,8 +90,21 @@ class QuotaManager:
 
     def __init__(self):
         """Initialize quota manager with empty state."""
-        self._quota_state: Dict[str, datetime] = {}  # model_name -> reset_time
+        self._quota_state: Dict[str, _QuotaEntry] = {}  # model_name -> reset entry
+        # Min-heap of (reset_mono, model_name). Entries are not removed when a
+        # model resets or is re-marked; stale heads are discarded on peek.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Heap head, kept current on every write so reset-time queries are a
+        # single attribute read with no lock
+        self._next_reset: Optional[_QuotaEntry] = None
         self._lock = threading.Lock()
+        # Sweeper thread, started on demand and exits once state is empty
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_wakeup = threading.Event()
+        # Bumped on every state change; keys the get_status() cache
+        self._state_version = 0
+        # (state version, monotonic time the report stays accurate until, report)
+        self._status_cache: Tuple[int, float, Dict[str, Dict[str, Any]]] = (-1, 0.0, {})
         logger.info("QuotaManager initialized")
 
     def mark_quota_exhausted(self, model_name: str, retry_delay_seconds: int):
@@ -49,40 +115,63 @@ class QuotaManager:
             model_name: Name of the Gemini model (e.g., 'gemini-2.0-flash-exp')
             retry_delay_seconds: Seconds until quota resets (from API error)
         """
-        reset_time = datetime.utcnow() + timedelta(seconds=retry_delay_seconds)
+        # Expiry is decided on the monotonic clock so NTP or manual clock
+        # changes cannot shorten or extend it; the wall-clock time is
+        # recorded once here for reporting only.
+        reset_mono = time.monotonic() + retry_delay_seconds
+        reset_time = self._to_datetime(reset_mono)
+
+        entry = _QuotaEntry(reset_mono, reset_time, reset_time.isoformat() + 'Z')
 
         with self._lock:
-            self._quota_state[model_name] = reset_time
+            self._quota_state[model_name] = entry
+            self._state_version += 1
+            heapq.heappush(self._expiry_heap, (reset_mono, model_name))
+            self._next_reset = self._peek_next_entry()
+            self._ensure_sweeper()
 
         logger.warning(
-            f"Model '{model_name}' quota exhausted. "
-            f"Reset at {reset_time.isoformat()} (in {retry_delay_seconds}s)"
+            "Model '%s' quota exhausted. Reset at %s (in %ss)",
+            model_name, entry.reset_iso, retry_delay_seconds
         )
 
-    def is_quota_available(self, model_name: str) -> bool:
+    def is_quota_available(self, model_name: str, now: Optional[float] = None) -> bool:
         """
         Check if model quota is available (not exhausted or past reset time).
 
         Args:
             model_name: Name of the Gemini model
+            now: Current time.monotonic() reading; read from the clock when
+                not given
 
         Returns:
             True if quota is available, False if exhausted
         """
-        with self._lock:
-            if model_name not in self._quota_state:
-                return True
-
-            reset_time = self._quota_state[model_name]
-
-            # Check if quota has reset (past reset time)
-            if datetime.utcnow() >= reset_time:
-                # Quota has reset, remove from state
-                del self._quota_state[model_name]
-                logger.info(f"Model '{model_name}' quota has reset and is now available")
-                return True
+        # Pure read, no lock: dict.get is atomic under the GIL, and this is
+        # the path every chat request takes for every model. Past-due entries
+        # are left for the sweeper thread to remove.
+        if not self._quota_state:
+            return True
+
+        entry = self._quota_state.get(model_name)
+        if entry is None:
+            return True
+
+        if now is None:
+            now = time.monotonic()
+        return now >= entry.reset_mono
+
+    @property
+    def has_exhausted_models(self) -> bool:
+        """
+        Cheap check for whether any model is currently marked exhausted.
 
-            return False
+        Reads the state without taking the lock (dict truthiness is atomic
+        under the GIL), so callers can skip per-model checks entirely in the
+        common case where no quota has been hit. Entries past their reset
+        time still count until the sweeper removes them.
+        """
+        return bool(self._quota_state)
 
     def get_next_reset_time(self) -> Optional[datetime]:
         """
@@ -91,10 +180,8 @@ class QuotaManager:
         Returns:
             Datetime of next reset, or None if no quotas exhausted
         """
-        with self._lock:
-            if not self._quota_state:
-                return None
-            return min(self._quota_state.values())
+        entry = self._next_reset
+        return entry.reset_time if entry else None
 
     def get_seconds_until_reset(self) -> Optional[int]:
         """
@@ -103,21 +190,23 @@ class QuotaManager:
         Returns:
             Seconds until reset, or None if no quotas exhausted
         """
-        reset_time = self.get_next_reset_time()
-        if not reset_time:
+        entry = self._next_reset
+        if entry is None:
             return None
 
-        delta = reset_time - datetime.utcnow()
-        seconds = int(delta.total_seconds())
-
-        return max(0, seconds)  # Never return negative
+        return max(0, int(entry.reset_mono - time.monotonic()))  # Never return negative
 
-    def get_status(self) -> Dict[str, Dict[str, any]]:
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
         """
         Get current quota status for all tracked models.
 
+        The report is cached until the state changes or one of the
+        seconds_until_reset values would tick over, so status pages polling
+        this every second do not rebuild it each time. Each caller gets its
+        own copy, safe to mutate or pass to jsonify().
+
         Returns:
-            Dictionary mapping model names to status info:
+            Dict mapping model names to status info:
             {
                 'gemini-2.0-flash-exp': {
                     'exhausted': True,
@@ -127,26 +216,155 @@ class QuotaManager:
                 ...
             }
         """
-        with self._lock:
-            status = {}
+        if not self._quota_state:
+            return {}
 
-            for model_name, reset_time in self._quota_state.items():
-                delta = reset_time - datetime.utcnow()
-                seconds = max(0, int(delta.total_seconds()))
+        # Read the clock once for every model in the report
+        now = time.monotonic()
 
-                status[model_name] = {
-                    'exhausted': True,
-                    'reset_time': reset_time.isoformat() + 'Z',
-                    'seconds_until_reset': seconds
-                }
+        version, valid_until, cached = self._status_cache
+        if version == self._state_version and now < valid_until:
+            return self._copy_status(cached)
+
+        version = self._state_version
+
+        # Shallow-copy the state instead of holding the lock while building
+        # the report; dict.copy() is atomic under the GIL and entries are
+        # immutable, so the snapshot is consistent without blocking writers.
+        snapshot = self._quota_state.copy()
+
+        status = {}
+        valid_until = float('inf')
+
+        for model_name, entry in snapshot.items():
+            remaining = entry.reset_mono - now
+            if remaining <= 0:
+                continue  # Already reset, awaiting sweep
+
+            seconds = int(remaining)
+            # seconds_until_reset for this model changes in (remaining - seconds)
+            valid_until = min(valid_until, now + (remaining - seconds))
 
-            return status
+            status[model_name] = {
+                'exhausted': True,
+                'reset_time': entry.reset_iso,
+                'seconds_until_reset': seconds
+            }
+
+        # Single tuple assignment, so concurrent readers never see a torn cache
+        self._status_cache = (version, valid_until, status)
+        return self._copy_status(status)
+
+    @staticmethod
+    def _copy_status(status: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Copy a cached report so callers cannot modify the cache."""
+        return {model_name: dict(info) for model_name, info in status.items()}
+
+    def _ensure_sweeper(self):
+        """Start the sweeper thread if it is not running. Caller must hold the lock."""
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                name='quota-manager-sweeper',
+                daemon=True
+            )
+            self._sweeper.start()
+        else:
+            # Re-evaluate the sleep in case the new entry resets sooner
+            self._sweeper_wakeup.set()
+
+    def _sweep_loop(self):
+        """Remove entries as their reset times pass; exit once none remain."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                expired = self._purge_expired(now)
+                if expired:
+                    self._state_version += 1
+
+                entry = self._next_reset = self._peek_next_entry()
+                if entry is None:
+                    self._sweeper = None
+                else:
+                    delay = entry.reset_mono - now
+                    self._sweeper_wakeup.clear()
+
+            for model_name in expired:
+                logger.info("Model '%s' quota has reset and is now available", model_name)
+
+            if entry is None:
+                return
+            self._sweeper_wakeup.wait(max(_SWEEP_MIN_INTERVAL, delay))
+
+    def _purge_expired(self, now: float) -> List[str]:
+        """
+        Remove entries whose reset time has passed. Caller must hold the lock.
+
+        Pops due heads off the expiry heap and deletes a model only if its
+        current entry is the one that heap item was pushed for; a model
+        re-marked since then keeps its newer entry. The sweeper is the only
+        caller, so each reset is removed and logged exactly once.
+
+        Returns:
+            Names of the models removed
+        """
+        removed = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            reset_mono, model_name = heapq.heappop(heap)
+            entry = self._quota_state.get(model_name)
+            if entry is not None and entry.reset_mono == reset_mono:
+                del self._quota_state[model_name]
+                removed.append(model_name)
+        return removed
+
+    def _peek_next_entry(self) -> Optional[_QuotaEntry]:
+        """
+        Get the entry with the earliest reset time. Caller must hold the lock.
+
+        Pops heap heads whose model has since reset or been re-marked with a
+        different reset time, so the live minimum is found without scanning
+        every model.
+        """
+        heap = self._expiry_heap
+        while heap:
+            reset_mono, model_name = heap[0]
+            entry = self._quota_state.get(model_name)
+            if entry is not None and entry.reset_mono == reset_mono:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    @staticmethod
+    def _to_datetime(monotonic_time: float, wall_offset: Optional[float] = None) -> datetime:
+        """
+        Convert a time.monotonic() timestamp to a naive UTC datetime.
+
+        Args:
+            monotonic_time: Timestamp from time.monotonic()
+            wall_offset: Precomputed offset from _wall_offset(), so callers
+                converting several timestamps read the clock only once
+        """
+        if wall_offset is None:
+            wall_offset = _wall_offset()
+        return datetime.utcfromtimestamp(monotonic_time + wall_offset)
 
     def clear_all(self):
-        """Clear all quota state (useful for testing)."""
+        """
+        Clear all quota state (useful for testing).
+
+        Swaps in fresh containers rather than clearing in place, so the lock
+        is held for a few reference assignments only, and lock-free readers
+        still holding the old dict finish against that consistent snapshot.
+        """
         with self._lock:
-            self._quota_state.clear()
-            logger.info("All quota state cleared")
+            self._quota_state = {}
+            self._expiry_heap = []
+            self._next_reset = None
+            self._state_version += 1
+            self._sweeper_wakeup.set()
+
+        logger.info("All quota state cleared")
 
 
 # Global singleton instance
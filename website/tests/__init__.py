@@ -5,5 +5,7 @@ Test Suite for Website Application
 Comprehensive test coverage for the primary-assistant website.
 
 Test Modules:
-- test_gemini_service_migration.py: Tests for Google GenAI SDK migration
+- gemini/: Tests for Google GenAI SDK migration, one module per area
+- test_quota_manager.py: Tests for Gemini model quota tracking
+- test_ai_coach_tools.py: Tests for AI coach function declarations
 """
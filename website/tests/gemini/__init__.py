@@ -0,0 +1 @@
+"""GeminiService tests, one module per area of the google.genai SDK migration."""
@@ -0,0 +1,81 @@
+"""
+Shared fixtures for the GeminiService tests.
+
+The tests in this package cover the migration from google.generativeai to
+the google.genai SDK, split into one module per area so pytest-xdist can
+spread them across workers.
+"""
+
+import copy
+import pytest
+from unittest.mock import MagicMock, patch
+
+from website.services import gemini_service
+from website.services.gemini_service import GeminiService
+
+# Placeholder returned by the mocked SDK constructors tests never inspect
+_SDK_OBJECT = object()
+
+
+@pytest.fixture(scope='session')
+def _sdk_mock_templates():
+    """
+    Build the genai, types and client mocks once per session.
+
+    Tests get deep copies (see _copy_template), which is cheaper than
+    constructing and wiring new MagicMocks every time.
+
+    Content, Part.from_text and SafetySetting return one shared placeholder
+    object instead of allocating a child mock per call; tests that inspect
+    those results set their own return_value.
+    """
+    fake_types = MagicMock()
+    fake_types.Content.return_value = _SDK_OBJECT
+    fake_types.Part.from_text.return_value = _SDK_OBJECT
+    fake_types.SafetySetting.return_value = _SDK_OBJECT
+    return {'genai': MagicMock(), 'types': fake_types, 'client': MagicMock()}
+
+
+def _copy_template(template):
+    """Deep-copy a template mock, keeping the shared placeholder's identity."""
+    return copy.deepcopy(template, {id(_SDK_OBJECT): _SDK_OBJECT})
+
+
+@pytest.fixture(autouse=True)
+def patch_genai(monkeypatch, request, _sdk_mock_templates):
+    """
+    Replace the SDK's genai and types modules with fresh mocks for each test.
+
+    Uses direct attribute assignment (monkeypatch) rather than stacking
+    @patch decorators on every test. The mocks are exposed to tests as
+    self.mock_genai and self.mock_types. The shared client cache is also
+    swapped out so each test sees its own mocked genai.Client.
+    """
+    fake_genai = _copy_template(_sdk_mock_templates['genai'])
+    fake_types = _copy_template(_sdk_mock_templates['types'])
+    monkeypatch.setattr(gemini_service, 'genai', fake_genai)
+    monkeypatch.setattr(gemini_service, 'types', fake_types)
+    monkeypatch.setattr(gemini_service, '_clients', {})
+    request.instance.mock_genai = fake_genai
+    request.instance.mock_types = fake_types
+
+
+@pytest.fixture(scope='session')
+def _service_prototype():
+    """Construct one GeminiService for the whole session against a mocked SDK."""
+    with patch.object(gemini_service, 'genai'), patch.object(gemini_service, '_clients', {}):
+        return GeminiService(api_key='test-key', model_names=['gemini-1.5-flash', 'gemini-1.5-flash-8b'])
+
+
+@pytest.fixture
+def service(_service_prototype, _sdk_mock_templates):
+    """
+    Shallow copy of the shared GeminiService prototype with a fresh mock client.
+
+    Tests that don't exercise __init__ itself use this instead of re-running
+    the constructor (env lookup, config resolution, logging) every time.
+    """
+    svc = copy.copy(_service_prototype)
+    svc.client = _copy_template(_sdk_mock_templates['client'])
+    svc.model_names = list(svc.model_names)
+    return svc
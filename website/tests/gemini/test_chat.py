@@ -0,0 +1,172 @@
+"""
+Chat Method Tests
+=================
+
+Tests for chat() with client.chats.create().
+
+Test Coverage:
+1. Chat creation and send_message
+2. Function declarations and disabled automatic function calling
+3. Model fallback on quota errors
+4. Backoff retries for transient server errors
+"""
+
+import pytest
+from unittest.mock import Mock
+from types import SimpleNamespace
+
+from website.services import gemini_service
+from website.services.gemini_service import QuotaExhaustedError
+
+
+class TestChatMethod:
+    """Test chat() method with new client.chats.create() API."""
+
+    @pytest.fixture(autouse=True)
+    def patch_quota_manager(self, service):
+        """Give the service a quota manager mock where every model is available."""
+        qm = Mock()
+        qm.is_quota_available.return_value = True
+        qm.get_seconds_until_reset.return_value = 3600
+        service.quota_manager = qm
+        self.qm = qm
+
+    @pytest.fixture
+    def mock_chat(self, service):
+        """Chat session returned by service.client.chats.create() with a plain text reply."""
+        mock_chat = Mock(spec=['send_message'])
+        mock_chat.send_message.return_value = SimpleNamespace(
+            text="Hello! How can I help you today?", function_calls=None
+        )
+        service.client.chats.create.return_value = mock_chat
+        return mock_chat
+
+    def test_chat_successful_with_simple_message(self, service, mock_chat):
+        """Test successful chat with a simple user message."""
+        response, function_call = service.chat("Hello", [])
+
+        # Verify chat was created
+        service.client.chats.create.assert_called_once()
+
+        # Verify send_message was called
+        mock_chat.send_message.assert_called_once_with(message="Hello")
+
+        # Verify response
+        assert response == "Hello! How can I help you today?"
+        assert function_call is None
+
+    def test_chat_with_function_declarations(self, service, mock_chat):
+        """Test chat with function declarations provided."""
+        # Function declarations
+        functions = [
+            {'name': 'create_health_metric', 'description': 'Log health data'}
+        ]
+
+        service.chat("I weigh 175 lbs", [], function_declarations=functions)
+
+        # Verify GenerateContentConfig was created
+        assert self.mock_types.GenerateContentConfig.called
+
+    def test_chat_disables_automatic_function_calling(self, service, mock_chat):
+        """Test that automatic_function_calling is disabled in config."""
+        service.chat("Test", [])
+
+        # Verify AutomaticFunctionCallingConfig was called with disable=True
+        self.mock_types.AutomaticFunctionCallingConfig.assert_called_with(disable=True)
+
+    def test_chat_falls_back_on_quota_error(self, service):
+        """Test model fallback when first model hits quota."""
+        # Setup mocks
+        mock_client = service.client
+
+        # First chat creation fails with quota error
+        mock_chat1 = Mock(spec=['send_message'])
+        quota_error = Exception("429 Resource exhausted")
+        mock_chat1.send_message.side_effect = quota_error
+
+        # Second chat creation succeeds
+        mock_chat2 = Mock(spec=['send_message'])
+        mock_response = SimpleNamespace(text="Success with fallback model", function_calls=None)
+        mock_chat2.send_message.return_value = mock_response
+
+        # Return different chats for each call
+        mock_client.chats.create.side_effect = [mock_chat1, mock_chat2]
+
+        # Chat should succeed with fallback
+        response, _ = service.chat("Test", [])
+
+        # Verify both models were tried
+        assert mock_client.chats.create.call_count == 2
+        assert response == "Success with fallback model"
+
+    def test_chat_raises_quota_exhausted_when_all_models_fail(self, service):
+        """Test QuotaExhaustedError when all models are exhausted."""
+        # Setup mocks
+        mock_client = service.client
+
+        # All chats fail with quota error
+        quota_error = Exception("429 Resource exhausted")
+        mock_chat = Mock(spec=['send_message'])
+        mock_chat.send_message.side_effect = quota_error
+        mock_client.chats.create.return_value = mock_chat
+
+        # Should raise QuotaExhaustedError
+        with pytest.raises(QuotaExhaustedError) as exc_info:
+            service.chat("Test", [])
+
+        assert "quota" in str(exc_info.value).lower()
+
+    def test_chat_retries_with_exponential_backoff(self, service, mock_chat, monkeypatch):
+        """Test that transient 5xx errors are retried on the same model with growing delays."""
+        sleep = Mock()
+        monkeypatch.setattr(gemini_service.time, 'sleep', sleep)
+        mock_chat.send_message.side_effect = [
+            Exception("503 UNAVAILABLE"),
+            Exception("503 UNAVAILABLE"),
+            SimpleNamespace(text="Recovered", function_calls=None),
+        ]
+
+        response, _ = service.chat("Test", [])
+
+        assert response == "Recovered"
+        service.client.chats.create.assert_called_once()
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert len(delays) == 2
+        assert delays == sorted(delays)
+        assert 0.5 <= delays[0] <= 1.0
+
+    def test_chat_does_not_retry_non_transient_errors(self, service, mock_chat, monkeypatch):
+        """Test that other errors propagate immediately without sleeping."""
+        sleep = Mock()
+        monkeypatch.setattr(gemini_service.time, 'sleep', sleep)
+        mock_chat.send_message.side_effect = ValueError("Invalid argument")
+
+        with pytest.raises(ValueError):
+            service.chat("Test", [])
+
+        sleep.assert_not_called()
+
+    def test_chat_skips_quota_checks_when_nothing_exhausted(self, service, mock_chat):
+        """Test that per-model quota checks are skipped when no model is exhausted."""
+        self.qm.has_exhausted_models = False
+
+        service.chat("Test", [])
+
+        self.qm.is_quota_available.assert_not_called()
+
+    def test_chat_checks_each_model_quota_at_its_own_time(self, service):
+        """Test that a model whose quota resets during earlier attempts is still tried."""
+        self.qm.has_exhausted_models = True
+        self.qm.is_quota_available.side_effect = lambda model_name: True
+        first_chat = Mock(spec=['send_message'])
+        first_chat.send_message.side_effect = Exception("429 RESOURCE_EXHAUSTED")
+        second_chat = Mock(spec=['send_message'])
+        second_chat.send_message.return_value = SimpleNamespace(text="Recovered", function_calls=None)
+        service.client.chats.create.side_effect = [first_chat, second_chat]
+
+        response, _ = service.chat("Test", [])
+
+        assert response == "Recovered"
+        assert [c.args for c in self.qm.is_quota_available.call_args_list] == [
+            ('gemini-1.5-flash',), ('gemini-1.5-flash-8b',)
+        ]
@@ -0,0 +1,120 @@
+"""
+Client Initialization Tests
+===========================
+
+Tests for GeminiService construction with the google.genai SDK and for
+validate_api_key().
+
+Test Coverage:
+1. Client initialization (API key from parameter, environment, error handling)
+2. Model fallback chain
+3. Shared client reuse
+4. API key validation
+"""
+
+import pytest
+from unittest.mock import Mock
+from types import SimpleNamespace
+
+from website.services.gemini_service import GeminiService
+
+
+class TestClientInitialization:
+    """Test GeminiService client initialization with new google.genai SDK."""
+
+    def test_client_initialization_with_api_key_parameter(self):
+        """Test that __init__ creates a genai.Client with API key from parameter."""
+        # Create mock client
+        mock_client = Mock(spec=['chats', 'models'])
+        self.mock_genai.Client.return_value = mock_client
+
+        # Initialize service with API key
+        service = GeminiService(api_key='test-api-key-123')
+
+        # Verify Client was created with correct API key
+        self.mock_genai.Client.assert_called_once_with(api_key='test-api-key-123')
+        assert service.client == mock_client
+        assert service.api_key == 'test-api-key-123'
+
+    def test_client_initialization_with_environment_variable(self, monkeypatch):
+        """Test that __init__ creates a genai.Client with API key from environment."""
+        monkeypatch.setenv('GEMINI_API_KEY', 'env-api-key-456')
+        mock_client = Mock(spec=['chats', 'models'])
+        self.mock_genai.Client.return_value = mock_client
+
+        # Initialize service without API key parameter
+        service = GeminiService()
+
+        # Verify Client was created with API key from environment
+        self.mock_genai.Client.assert_called_once_with(api_key='env-api-key-456')
+        assert service.client == mock_client
+        assert service.api_key == 'env-api-key-456'
+
+    def test_client_initialization_raises_error_when_api_key_missing(self, monkeypatch):
+        """Test that __init__ raises ValueError when API key is not provided."""
+        # Ensure GEMINI_API_KEY is not in environment
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+
+        # Attempt to initialize without API key
+        with pytest.raises(ValueError) as exc_info:
+            GeminiService()
+
+        assert 'GEMINI_API_KEY not found' in str(exc_info.value)
+
+    def test_client_initialization_stores_model_fallback_chain(self):
+        """Test that __init__ stores the model fallback chain correctly."""
+        self.mock_genai.Client.return_value = Mock(spec=['chats', 'models'])
+        service = GeminiService(api_key='test-key')
+
+        # Verify model_names contains expected models in correct order
+        assert isinstance(service.model_names, list)
+        assert len(service.model_names) >= 2
+        assert 'gemini-1.5-flash' in service.model_names
+        assert 'gemini-1.5-flash-8b' in service.model_names
+
+    def test_client_initialization_accepts_model_names(self):
+        """Test that an explicit model_names list overrides the default fallback chain."""
+        service = GeminiService(api_key='test-key', model_names=['gemini-2.5-flash'])
+
+        assert service.model_names == ['gemini-2.5-flash']
+
+    def test_client_is_shared_across_instances_with_same_key(self):
+        """Test that services using the same API key reuse one genai.Client."""
+        self.mock_genai.Client.return_value = Mock(spec=['chats', 'models'])
+
+        first = GeminiService(api_key='test-key')
+        second = GeminiService(api_key='test-key')
+
+        self.mock_genai.Client.assert_called_once_with(api_key='test-key')
+        assert first.client is second.client
+
+
+class TestAPIKeyValidation:
+    """Test validate_api_key() static method."""
+
+    def test_validate_api_key_with_valid_key(self):
+        """Test that valid API key returns True."""
+        # Mock successful API call
+        mock_client = Mock(spec=['chats', 'models'])
+        self.mock_genai.Client.return_value = mock_client
+
+        mock_response = SimpleNamespace(text="Test response")
+        mock_client.models.generate_content.return_value = mock_response
+
+        # Validate key
+        result = GeminiService.validate_api_key('valid-api-key')
+
+        # Verify
+        assert result is True
+        self.mock_genai.Client.assert_called_with(api_key='valid-api-key')
+
+    def test_validate_api_key_with_invalid_key(self):
+        """Test that invalid API key returns False."""
+        # Mock API error
+        self.mock_genai.Client.side_effect = Exception("Invalid API key")
+
+        # Validate key
+        result = GeminiService.validate_api_key('invalid-key')
+
+        # Verify
+        assert result is False
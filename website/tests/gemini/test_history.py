@@ -0,0 +1,80 @@
+"""
+History Building Tests
+======================
+
+Tests for converting conversation history into types.Content objects.
+
+Test Coverage:
+1. Dict to Content conversion
+2. Role mapping
+3. Pass-through of ingested contents
+"""
+
+from unittest.mock import Mock
+
+
+# Shared, read-only conversation used by the history tests; _build_history()
+# only iterates it, so tests pass the tuple directly.
+SAMPLE_HISTORY = (
+    {'role': 'user', 'content': 'User message'},
+    {'role': 'assistant', 'content': 'Assistant message'},
+)
+
+
+class TestHistoryBuilding:
+    """Test _build_history() converts dict messages to types.Content objects."""
+
+    def test_build_history_converts_dicts_to_content_objects(self, service):
+        """Test that _build_history() converts dict messages to Content objects."""
+        result = service._build_history(SAMPLE_HISTORY)
+
+        # Verify result is a list
+        assert isinstance(result, list)
+
+        # Verify Content was called for each message
+        # (Note: might be called more times for system prompt)
+        assert self.mock_types.Content.call_count >= len(SAMPLE_HISTORY)
+
+    def test_build_history_maps_roles_correctly(self, service):
+        """Test that user → user and assistant → model role mapping works."""
+        service._build_history(SAMPLE_HISTORY)
+
+        # Check role mapping in Content calls
+        content_calls = self.mock_types.Content.call_args_list
+        user_roles = [call[1]['role'] for call in content_calls if 'role' in call[1]]
+
+        # Should have both 'user' and 'model' roles
+        assert 'user' in user_roles
+        assert 'model' in user_roles
+
+    def test_build_history_uses_part_from_text(self, service):
+        """Test that _build_history() uses types.Part.from_text() for message content."""
+        mock_part = Mock(spec=[])
+        self.mock_types.Part.from_text.return_value = mock_part
+
+        service._build_history(SAMPLE_HISTORY[:1])
+
+        # Verify Part.from_text was called
+        assert self.mock_types.Part.from_text.call_count >= 1
+
+        # Verify it was called with message content
+        from_text_calls = [call[0][0] for call in self.mock_types.Part.from_text.call_args_list]
+        assert any('User message' in call for call in from_text_calls)
+
+    def test_build_history_handles_empty_history(self, service):
+        """Test that _build_history() handles empty conversation history."""
+        # Build history with no messages
+        result = service._build_history([])
+
+        # Should return a list (may contain system prompt)
+        assert isinstance(result, list)
+
+    def test_build_history_passes_through_ingested_contents(self, service):
+        """Test that Content objects from ingest_history() are not converted again."""
+        ingested = service.ingest_history([{'role': 'user', 'content': 'Hello'}])
+        assert self.mock_types.Content.call_count == 1
+
+        result = service._build_history(ingested + [{'role': 'assistant', 'content': 'Hi'}])
+
+        assert result[0] is ingested[0]
+        assert self.mock_types.Content.call_count == 2
@@ -0,0 +1,89 @@
+"""
+Integration Scenario Tests
+==========================
+
+End-to-end conversations through GeminiService against a mocked SDK.
+
+Test Coverage:
+1. Multi-turn conversation without functions
+2. Conversation with a function call
+"""
+
+import pytest
+from unittest.mock import Mock
+from types import SimpleNamespace
+
+
+class TestIntegrationScenarios:
+    """Integration tests for complete conversation flows."""
+
+    @pytest.fixture
+    def mock_chat(self, service):
+        """Chat session returned by service.client.chats.create() for every turn."""
+        mock_chat = Mock(spec=['send_message'])
+        service.client.chats.create.return_value = mock_chat
+        return mock_chat
+
+    def test_simple_conversation_without_functions(self, service, mock_chat):
+        """Test a simple back-and-forth conversation."""
+        # One reply per turn, built only when that turn is sent
+        replies = (
+            "Hello! I'm your fitness coach. How can I help?",
+            "Great! Let's track your progress.",
+        )
+        mock_chat.send_message.side_effect = (
+            SimpleNamespace(text=text, function_calls=None) for text in replies
+        )
+
+        # First message
+        response1, fc1 = service.chat("Hello", [])
+        assert "coach" in response1.lower()
+        assert fc1 is None
+
+        # Second message with history
+        history = [
+            {'role': 'user', 'content': 'Hello'},
+            {'role': 'assistant', 'content': response1}
+        ]
+        response2, fc2 = service.chat("I want to track my weight", history)
+        assert len(response2) > 0
+        assert fc2 is None
+
+    def test_conversation_with_function_call(self, service, mock_chat):
+        """Test conversation that triggers a function call."""
+        # Mock function call
+        mock_fc = SimpleNamespace(name='create_health_metric', args={
+            'recorded_date': '2026-01-06',
+            'weight': 176.0,
+            'unit': 'lbs'
+        })
+
+        mock_response = SimpleNamespace(text="I've prepared your weight entry.", function_calls=[mock_fc])
+
+        mock_chat.send_message.return_value = mock_response
+
+        functions = [
+            {
+                'name': 'create_health_metric',
+                'description': 'Log weight and body metrics',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'recorded_date': {'type': 'string'},
+                        'weight': {'type': 'number'}
+                    }
+                }
+            }
+        ]
+
+        # Send message
+        response, function_call = service.chat(
+            "I weighed 176 lbs today",
+            [],
+            function_declarations=functions
+        )
+
+        # Verify function call
+        assert function_call is not None
+        assert function_call['name'] == 'create_health_metric'
+        assert function_call['args']['weight'] == 176.0
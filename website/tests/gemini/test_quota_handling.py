@@ -0,0 +1,81 @@
+"""
+Quota Handling Tests
+====================
+
+Tests for quota error detection and retry delay parsing.
+
+Test Coverage:
+1. Quota error detection
+2. Retry delay extraction (error text, Retry-After header, HTTP date, clamping)
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from website.services import gemini_service
+
+
+class TestQuotaHandling:
+    """Test quota error detection and model fallback."""
+
+    @pytest.mark.parametrize('message', [
+        "429 Resource exhausted",
+        "Quota exceeded for this API key",
+        "Rate limit exceeded",
+    ])
+    def test_is_quota_error_detects_quota_errors(self, service, message):
+        """Test that _is_quota_error() detects 429 status, 'quota' and rate limit errors."""
+        assert service._is_quota_error(Exception(message)) is True
+
+    def test_extract_retry_delay_parses_seconds(self, service):
+        """Test that _extract_retry_delay() parses retry seconds."""
+        error = Exception("retry_delay { seconds: 51 }")
+        delay = service._extract_retry_delay(error)
+
+        assert delay == 51
+
+    @pytest.mark.parametrize('message, expected', [
+        ("'retryDelay': '51s'", 51),
+        ("Retry-After: 30", 30),
+        # Longer server hints are capped so the model is retried within 15 minutes
+        ("retry_delay { seconds: 86400 }", 900),
+    ])
+    def test_extract_retry_delay_parses_other_formats(self, service, message, expected):
+        """Test JSON and Retry-After hints in the error text, clamped to 900s."""
+        assert service._extract_retry_delay(Exception(message)) == expected
+
+    def test_extract_retry_delay_is_cached(self, service, monkeypatch):
+        """Test that repeated error text is only matched against the regex once."""
+        gemini_service._parse_retry_delay_text.cache_clear()
+        retry_re = Mock(wraps=gemini_service._RETRY_DELAY_RE)
+        monkeypatch.setattr(gemini_service, '_RETRY_DELAY_RE', retry_re)
+
+        assert service._extract_retry_delay(Exception("retry_delay { seconds: 42 }")) == 42
+        assert service._extract_retry_delay(Exception("retry_delay { seconds: 42 }")) == 42
+
+        retry_re.search.assert_called_once()
+
+    def test_extract_retry_delay_from_header(self, service):
+        """Test that a Retry-After header on the response wins over the error text."""
+        error = Exception("retry_delay { seconds: 51 }")
+        error.response = SimpleNamespace(headers={'retry-after': '12'})
+
+        assert service._extract_retry_delay(error) == 12
+
+    def test_extract_retry_delay_from_http_date(self, service):
+        """Test that an HTTP-date Retry-After header is converted to seconds from now."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+        error = Exception("429 Resource exhausted")
+        error.response = SimpleNamespace(headers={'retry-after': format_datetime(retry_at, usegmt=True)})
+
+        assert 115 <= service._extract_retry_delay(error) <= 120
+
+    def test_extract_retry_delay_defaults_to_60(self, service):
+        """Test that _extract_retry_delay() defaults to 60s when there is no hint."""
+        error = Exception("Some error without retry delay")
+        delay = service._extract_retry_delay(error)
+
+        assert delay == 60
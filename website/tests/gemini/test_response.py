@@ -0,0 +1,66 @@
+"""
+Response Extraction Tests
+=========================
+
+Tests for _extract_response() using response.text and response.function_calls.
+
+Test Coverage:
+1. Text extraction
+2. Single and multiple function calls
+3. Default messages for function-only responses
+"""
+
+import pytest
+from types import SimpleNamespace
+
+
+def _make_response(text="", calls=()):
+    """Build a stub Gemini response with the given text and (name, args) function calls."""
+    function_calls = [SimpleNamespace(name=name, args=args) for name, args in calls]
+    return SimpleNamespace(text=text, function_calls=function_calls or None)
+
+
+class TestResponseExtraction:
+    """Test _extract_response() uses response.text and response.function_calls."""
+
+    @pytest.mark.parametrize('text, calls, expected_function_call', [
+        # Plain text response uses the response.text convenience property
+        ("This is the response text", [], None),
+        # Single function call is returned unwrapped
+        ("I've logged your breakfast.",
+         [('create_meal_log', {'meal_type': 'breakfast', 'calories': 650})],
+         {'name': 'create_meal_log', 'args': {'meal_type': 'breakfast', 'calories': 650}}),
+        # Multiple function calls are wrapped in a special structure
+        ("I've logged everything.",
+         [('create_health_metric', {'weight': 176}),
+          ('create_workout', {'duration': 60}),
+          ('create_meal_log', {'calories': 650})],
+         {'name': 'multiple_function_calls', 'function_calls': [
+             {'name': 'create_health_metric', 'args': {'weight': 176}},
+             {'name': 'create_workout', 'args': {'duration': 60}},
+             {'name': 'create_meal_log', 'args': {'calories': 650}},
+         ]}),
+    ])
+    def test_extract_response(self, service, text, calls, expected_function_call):
+        """Test extraction of response text and function call(s) from the response."""
+        assistant_response, function_call = service._extract_response(_make_response(text, calls))
+
+        assert assistant_response == text
+        assert function_call == expected_function_call
+
+    @pytest.mark.parametrize('calls, expected_name, expected_words', [
+        # Single function call with no text gets a prepared/review message
+        ([('create_health_metric', {'weight': 175, 'date': '2026-01-06'})],
+         'create_health_metric', ("prepared", "review")),
+        # Multiple function calls with no text mention the record count
+        ([('create_health_metric', {}), ('create_workout', {})],
+         'multiple_function_calls', ("2 records",)),
+    ])
+    def test_extract_response_provides_default_message_for_function_only(
+        self, service, calls, expected_name, expected_words
+    ):
+        """Test default message when only function call(s), no text."""
+        text, function_call = service._extract_response(_make_response("", calls))
+
+        assert function_call['name'] == expected_name
+        assert any(word in text.lower() for word in expected_words)
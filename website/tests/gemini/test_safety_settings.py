@@ -0,0 +1,36 @@
+"""
+Safety Settings Tests
+=====================
+
+Tests for _get_safety_settings() in the google.genai SDK format.
+
+Test Coverage:
+1. Safety settings format (list of SafetySetting objects, string values)
+"""
+
+
+class TestSafetySettings:
+    """Test _get_safety_settings() returns correct format for new SDK."""
+
+    def test_safety_settings_format(self, service):
+        """Test that _get_safety_settings() returns a list of 4 SafetySetting objects built from strings."""
+        safety_settings = service._get_safety_settings()
+
+        # Verify it's a list (the old SDK took a dict)
+        assert isinstance(safety_settings, list)
+
+        # Verify all 4 harm categories were built as SafetySetting objects
+        assert len(safety_settings) == 4
+        assert self.mock_types.SafetySetting.call_count == 4
+        for setting in safety_settings:
+            assert setting is self.mock_types.SafetySetting.return_value
+
+        # Check that SafetySetting was called with string arguments, not enums
+        # in the expected HARM_CATEGORY_* / BLOCK_* format
+        kwargs_list = [c.kwargs for c in self.mock_types.SafetySetting.call_args_list]
+        assert all(
+            isinstance(k['category'], str) and 'HARM_CATEGORY_' in k['category'] for k in kwargs_list
+        ), kwargs_list
+        assert all(
+            isinstance(k['threshold'], str) and 'BLOCK_' in k['threshold'] for k in kwargs_list
+        ), kwargs_list
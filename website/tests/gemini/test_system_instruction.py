@@ -0,0 +1,55 @@
+"""
+System Instruction Tests
+========================
+
+Tests for _get_contextualized_system_instruction().
+
+Test Coverage:
+1. Current date and day of week injection
+2. Instruction format
+"""
+
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+
+from website.services import gemini_service
+
+
+class TestSystemInstruction:
+    """Test _get_contextualized_system_instruction() includes current date."""
+
+    FROZEN_NOW = datetime(2025, 1, 15, 9, 30)
+
+    @pytest.fixture(autouse=True, scope='class')
+    def frozen_now(self):
+        """Pin gemini_service.datetime.now() so date assertions can't straddle midnight."""
+        frozen = Mock(wraps=datetime)
+        frozen.now.return_value = self.FROZEN_NOW
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(gemini_service, 'datetime', frozen)
+            yield
+
+    def test_system_instruction_includes_current_date(self, service):
+        """Test that system instruction includes current date."""
+        instruction = service._get_contextualized_system_instruction()
+
+        # Verify current date is in the instruction
+        assert 'CURRENT DATE: 2025-01-15' in instruction
+        assert 'use the date 2025-01-15' in instruction
+
+    def test_system_instruction_includes_day_of_week(self, service):
+        """Test that system instruction includes day of week."""
+        instruction = service._get_contextualized_system_instruction()
+
+        # Verify day of week is in the instruction
+        assert '(Wednesday)' in instruction
+
+    def test_system_instruction_format_matches_expected_pattern(self, service):
+        """Test that system instruction starts with CURRENT DATE."""
+        instruction = service._get_contextualized_system_instruction()
+
+        # Verify format
+        assert instruction.startswith('CURRENT DATE:')
+        assert 'IMPORTANT:' in instruction
+        assert 'Transformative Trainer' in instruction or 'trainer' in instruction.lower()
@@ -0,0 +1,100 @@
+"""
+Route Tests for the AI Coach Message Endpoint
+=============================================
+
+Tests for POST /api/ai-coach/message with the database, the logged-in user
+and GeminiService replaced by fakes.
+
+Test Coverage:
+1. One Gemini call per WRITE turn, with the full tool declarations
+2. READ turns: query handler plus one data-informed follow-up
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from flask import Flask
+
+from website.api import ai_coach
+from website.services import gemini_service
+from website.utils.ai_coach_tools import get_all_function_declarations
+
+
+class FakeConversation:
+    """Stand-in for ConversationLog that keeps messages in memory."""
+
+    id = 42
+    title = None
+
+    def __init__(self, **kwargs):
+        self.messages = []
+
+    @property
+    def message_count(self):
+        return len(self.messages)
+
+    def add_message(self, role, content, metadata=None):
+        self.messages.append({'role': role, 'content': content, 'metadata': metadata})
+
+    def generate_title(self):
+        return 'New conversation'
+
+
+@pytest.fixture
+def gemini():
+    """Mocked GeminiService instance returned by the patched constructor."""
+    service = MagicMock()
+    service.ingest_history.return_value = []
+    return service
+
+
+@pytest.fixture
+def send(monkeypatch, gemini):
+    """Call send_message (minus the login decorator) with a JSON body."""
+    monkeypatch.setattr(ai_coach, 'current_user', MagicMock(id=7))
+    monkeypatch.setattr(ai_coach, 'db', MagicMock())
+    monkeypatch.setattr(ai_coach, 'ConversationLog', FakeConversation)
+    monkeypatch.setattr(gemini_service, 'GeminiService', MagicMock(return_value=gemini))
+
+    app = Flask(__name__)
+
+    def _send(message):
+        with app.test_request_context('/api/ai-coach/message', method='POST', json={'message': message}):
+            response, status = ai_coach.send_message.__wrapped__()
+            return response.get_json(), status
+
+    return _send
+
+
+class TestSendMessage:
+    """Test the Gemini calls made by send_message()."""
+
+    def test_write_turn_makes_one_call_with_full_declarations(self, send, gemini):
+        """Test that a WRITE function call is returned from a single chat call."""
+        function_call = {'name': 'create_health_metric', 'args': {'weight_lbs': 180}}
+        gemini.chat.return_value = ('Logging that for you.', function_call)
+
+        body, status = send('I weighed 180 today')
+
+        assert status == 200
+        assert gemini.chat.call_count == 1
+        assert gemini.chat.call_args.kwargs['function_declarations'] == get_all_function_declarations()
+        assert body['data']['function_call'] == function_call
+        assert body['data']['response'] == 'Logging that for you.'
+
+    def test_read_turn_runs_query_then_follow_up(self, send, gemini, monkeypatch):
+        """Test that a READ call is executed and answered without further tools."""
+        handler = MagicMock(return_value=({}, 'Weight is down 2 lbs'))
+        monkeypatch.setattr(ai_coach, '_query_health_metrics', handler)
+        gemini.chat.side_effect = [
+            ('', {'name': 'get_recent_health_metrics', 'args': {'days': 7}}),
+            ('Nice progress this week.', None),
+        ]
+
+        body, status = send('How is my weight trending?')
+
+        assert status == 200
+        handler.assert_called_once_with(7, {'days': 7})
+        assert gemini.chat.call_count == 2
+        assert gemini.chat.call_args.kwargs['function_declarations'] is None
+        assert body['data']['response'] == 'Nice progress this week.'
+        assert 'function_call' not in body['data']
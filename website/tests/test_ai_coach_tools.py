@@ -0,0 +1,91 @@
+"""
+Unit Tests for AI Coach Function Tools
+======================================
+
+Tests for the cached, read-only Gemini function declarations.
+
+Test Coverage:
+1. Declarations are built once and shared
+2. Schemas are deeply read-only
+3. Lookup by name
+4. Declaration structure (checked here rather than on every request)
+"""
+
+import pytest
+
+from collections.abc import Mapping
+
+from website.utils import ai_coach_tools
+
+# OpenAPI subset types Gemini accepts in function declaration parameters
+SCHEMA_TYPES = {'string', 'number', 'integer', 'boolean', 'array', 'object'}
+
+
+def _check_parameter_schema(schema, path):
+    """Recursively check one parameter schema, reporting the offending path."""
+    assert isinstance(schema, Mapping), path
+    if 'anyOf' in schema:
+        for i, variant in enumerate(schema['anyOf']):
+            _check_parameter_schema(variant, f'{path}|{i}')
+        return
+    assert schema.get('type') in SCHEMA_TYPES, path
+    if 'enum' in schema:
+        assert schema['enum'] and all(isinstance(v, str) for v in schema['enum']), path
+    if schema['type'] == 'array':
+        _check_parameter_schema(schema['items'], f'{path}[]')
+    if schema['type'] == 'object':
+        properties = schema.get('properties', {})
+        assert set(schema.get('required', ())) <= set(properties), path
+        for name, prop in properties.items():
+            _check_parameter_schema(prop, f'{path}.{name}')
+
+
+class TestFunctionDeclarations:
+    """Test get_all_function_declarations() and get_function_schema_by_name()."""
+
+    def test_declarations_are_shared_between_calls(self):
+        """Test that repeated calls return the same schema objects."""
+        first = ai_coach_tools.get_all_function_declarations()
+        second = ai_coach_tools.get_all_function_declarations()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert ai_coach_tools.create_health_metric_schema() in first
+
+    def test_schemas_are_read_only(self):
+        """Test that nested dicts and lists in a schema cannot be mutated."""
+        schema = ai_coach_tools.get_function_schema_by_name('create_health_metric')
+
+        with pytest.raises(TypeError):
+            schema['name'] = 'other'
+        with pytest.raises(TypeError):
+            schema['parameters']['properties']['weight_lbs']['type'] = 'string'
+        assert schema['parameters']['required'] == ('recorded_date',)
+
+    def test_schema_lookup_by_name(self):
+        """Test that every declaration can be looked up by its name."""
+        for schema in ai_coach_tools.get_all_function_declarations():
+            assert ai_coach_tools.get_function_schema_by_name(schema['name']) is schema
+
+    def test_unknown_schema_name_raises(self):
+        """Test that an unknown function name raises ValueError."""
+        with pytest.raises(ValueError, match='Unknown function'):
+            ai_coach_tools.get_function_schema_by_name('create_batch_records')
+
+    def test_declarations_are_well_formed(self):
+        """Test that every declaration has a name, description and valid object parameters."""
+        for schema in ai_coach_tools.get_all_function_declarations():
+            assert schema['name'] and schema['description'], schema['name']
+            assert schema['parameters']['type'] == 'object', schema['name']
+            _check_parameter_schema(schema['parameters'], schema['name'])
+
+    def test_batch_record_data_reuses_record_schemas(self):
+        """Test that batch record data offers each single-record schema's parameters."""
+        schema = ai_coach_tools.create_batch_records_schema()
+        item = schema['parameters']['properties']['records']['items']
+
+        assert item['properties']['data']['anyOf'][0] is (
+            ai_coach_tools.create_health_metric_schema()['parameters']
+        )
+        assert len(item['properties']['data']['anyOf']) == len(item['properties']['record_type']['enum'])
+        _check_parameter_schema(schema['parameters'], schema['name'])
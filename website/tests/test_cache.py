@@ -0,0 +1,203 @@
+"""
+Unit Tests for Caching Utilities
+================================
+
+Tests for SimpleCache and the cached / cache_bust decorators.
+
+Test Coverage:
+1. SimpleCache LRU eviction, stats and hit/miss counting
+2. cached() key generation and reuse
+3. cache_bust() pattern and prefix invalidation
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+
+from website.utils import cache as cache_module
+from website.utils.cache import CacheStats, SimpleCache, cached, cache_bust
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """Give each test its own global cache instead of the process-wide one."""
+    fresh = SimpleCache(default_timeout=300)
+    monkeypatch.setattr(cache_module, '_cache', fresh)
+    return fresh
+
+
+class TestSimpleCache:
+    """Test SimpleCache bounds and statistics."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that a full cache drops the entry that was used longest ago."""
+        cache = SimpleCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert 'b' not in cache.timeouts
+
+    def test_expired_entries_are_swept_without_being_read(self, monkeypatch):
+        """Test that set() drops entries whose expiry has passed even if never read again."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, 'time', lambda: now[0])
+        cache = SimpleCache()
+        cache.set('short', 1, timeout=10)
+        cache.set('long', 2, timeout=100)
+        cache.set('short', 3, timeout=50)  # re-set: the 10s heap record is stale
+
+        now[0] += 20
+        cache.set('other', 4)
+        assert set(cache.cache) == {'short', 'long', 'other'}
+
+        now[0] += 40
+        cache.set('other', 5)
+        assert set(cache.cache) == {'long', 'other'}
+        assert 'short' not in cache.timeouts
+
+    def test_stats_estimate_size_from_sample(self):
+        """Test that size_bytes scales the sampled value size by the entry count."""
+        cache = SimpleCache()
+        for i in range(100):
+            cache.set(f'key{i}', 'x' * 8)
+
+        stats = cache.get_stats()
+
+        assert stats['entries'] == 100
+        assert stats['size_bytes'] == 100 * len('"xxxxxxxx"')
+        assert SimpleCache().get_stats()['size_bytes'] == 0
+
+    def test_concurrent_writes_and_busts(self):
+        """Test that busting while other threads write never sees a dict change size."""
+        cache = SimpleCache(max_entries=100)
+        errors = []
+
+        def write(n):
+            try:
+                for i in range(2000):
+                    cache.set(f'post:{n}:{i}', i)
+                    cache.get(f'post:{n}:{i // 2}')
+            except Exception as e:  # pragma: no cover - only on failure
+                errors.append(e)
+
+        def bust():
+            try:
+                for _ in range(500):
+                    cache.delete_matching('post:')
+            except Exception as e:  # pragma: no cover - only on failure
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        threads.append(threading.Thread(target=bust))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache.cache) <= 100
+
+    def test_get_records_hits_and_misses(self):
+        """Test that lookups are counted in the attached CacheStats."""
+        stats = CacheStats()
+        cache = SimpleCache(stats=stats)
+        cache.set('a', 1)
+
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+
+        assert stats.get_stats() == {'hits': 2, 'misses': 1, 'total_calls': 3, 'hit_rate': pytest.approx(200 / 3)}
+
+
+class TestCachedDecorator:
+    """Test cached() result reuse and cache keys."""
+
+    def test_repeated_call_hits_cache(self):
+        """Test that the same arguments call the function only once."""
+        func = Mock(return_value='result', __name__='load')
+        load = cached(key_prefix='load')(func)
+
+        assert load(1, limit=5) == 'result'
+        assert load(1, limit=5) == 'result'
+        func.assert_called_once_with(1, limit=5)
+
+    def test_distinct_arguments_get_distinct_keys(self, fresh_cache):
+        """Test that equal-hashing but different arguments are cached separately."""
+        load = cached(key_prefix='load')(lambda value: repr(value))
+
+        assert load(1) == '1'
+        assert load(True) == 'True'
+        assert len(fresh_cache.cache) == 2
+
+    def test_keyword_order_does_not_matter(self, fresh_cache):
+        """Test that kwargs given in a different order share one entry."""
+        load = cached(key_prefix='load')(lambda **kwargs: sorted(kwargs))
+
+        load(a=1, b=2)
+        load(b=2, a=1)
+        assert len(fresh_cache.cache) == 1
+
+    def test_unhashable_arguments_fall_back_to_json_keys(self, fresh_cache):
+        """Test that dict arguments are keyed canonically regardless of order."""
+        func = Mock(return_value='result', __name__='load')
+        load = cached(key_prefix='load')(func)
+
+        load({'a': 1, 'b': 2})
+        load({'b': 2, 'a': 1})
+        func.assert_called_once()
+        assert list(fresh_cache.cache) == ['load:[[{"a": 1, "b": 2}], {}]']
+
+
+class TestCacheBust:
+    """Test cache_bust() invalidation."""
+
+    def test_cache_bust_deletes_matching_keys(self, fresh_cache):
+        """Test that only keys containing the pattern are removed."""
+        fresh_cache.set('blog_post:intro', 'post')
+        fresh_cache.set('projects:all', 'projects')
+
+        cache_bust('blog_post')(lambda: None)()
+
+        assert fresh_cache.get('blog_post:intro') is None
+        assert fresh_cache.get('projects:all') == 'projects'
+
+    def test_cache_bust_by_prefix_uses_index(self, fresh_cache):
+        """Test that key_prefix clears exactly one cached() function's entries."""
+        load = cached(key_prefix='posts')(lambda n: n)
+        load(1)
+        load(2)
+        fresh_cache.set('post_intro', 'unrelated')
+        fresh_cache.set('tags:posts', 'other prefix')
+
+        cache_bust(key_prefix='posts')(lambda: None)()
+
+        assert list(fresh_cache.cache) == ['post_intro', 'tags:posts']
+        assert 'posts' not in fresh_cache._by_prefix
+
+    def test_delete_nested_prefix_scans_first_segment(self, fresh_cache):
+        """Test that a prefix containing ':' still finds the keys under it."""
+        load = cached(key_prefix='api:posts')(lambda n: n)
+        load(1)
+        load(2)
+        fresh_cache.set('api:tags:1', 'tags')
+        fresh_cache.set('api:postscript', 'no separator after the prefix')
+
+        assert fresh_cache.delete_prefix('api:posts') == 2
+
+        assert list(fresh_cache.cache) == ['api:tags:1', 'api:postscript']
+        assert fresh_cache._by_prefix['api'] == {'api:tags:1', 'api:postscript'}
+
+    def test_prefix_index_follows_eviction_and_delete(self):
+        """Test that evicted and deleted keys are dropped from the prefix index."""
+        cache = SimpleCache(max_entries=1)
+        cache.set('a:1', 1)
+        cache.set('b:1', 2)
+        cache.delete('b:1')
+
+        assert dict(cache._by_prefix) == {}
@@ -0,0 +1,376 @@
+"""
+Unit Tests for File Utilities
+=============================
+
+Tests for blog post parsing, project file listing, categorization and
+health data parsing.
+
+Test Coverage:
+1. Blog post front matter and markdown rendering
+2. Reuse of parsed files until they change
+3. Project file listing
+4. File categorization
+5. Health data parsing
+6. Reuse of virtual pages until the user's data changes
+"""
+
+import os
+import markdown
+import pytest
+from unittest.mock import Mock
+
+from website.utils import file_utils
+from website.utils.file_utils import BlogPostParser, FileCategorizer, HealthDataParser, ProjectFileManager
+
+SAMPLE_POST = """---
+title: Progressive Overload
+tags: [training, strength]
+published: true
+order: 3
+---
+# Heading
+
+| Lift | Sets |
+|------|------|
+| Squat | 5 |
+
+```python
+print('hi')
+```
+"""
+
+
+@pytest.fixture
+def post_file(tmp_path):
+    """A blog post markdown file with front matter."""
+    path = tmp_path / 'post.md'
+    path.write_text(SAMPLE_POST)
+    return path
+
+
+class TestBlogPostParser:
+    """Test BlogPostParser.parse()."""
+
+    def test_parse_reads_front_matter(self, post_file):
+        """Test that metadata lists, booleans and numbers are parsed."""
+        post = BlogPostParser.parse(str(post_file))
+
+        assert post['metadata'] == {
+            'title': 'Progressive Overload',
+            'tags': ['training', 'strength'],
+            'published': True,
+            'order': 3,
+        }
+        assert post['content'].startswith('# Heading')
+
+    def test_parse_renders_like_markdown_module(self, post_file):
+        """Test that the shared converter matches a fresh markdown.markdown() call on repeat use."""
+        expected = markdown.markdown(
+            BlogPostParser.parse(str(post_file))['content'], extensions=['tables', 'codehilite']
+        )
+
+        assert BlogPostParser.parse(str(post_file))['html'] == expected
+        assert BlogPostParser.parse(str(post_file))['html'] == expected
+        assert '<table>' in expected
+
+    def test_parse_without_front_matter_returns_none(self, tmp_path):
+        """Test that files without a front matter block are rejected."""
+        path = tmp_path / 'plain.md'
+        path.write_text('# Just markdown\n')
+
+        assert BlogPostParser.parse(str(path)) is None
+
+    @pytest.mark.parametrize('text, expected', [
+        ('---\ntitle: A\n---\nBody\n---\nMore\n', ({'title': 'A'}, 'Body\n---\nMore')),
+        ('---\n\n---\nBody\n', ({}, 'Body')),
+        ('---\r\ntitle: A\r\n---\r\nBody\r\n', ({'title': 'A'}, 'Body')),
+        ('---\ntitle: A\nBody without a closing fence\n', None),
+        ('Intro\n---\ntitle: A\n---\nBody\n', None),
+    ])
+    def test_front_matter_fences(self, tmp_path, text, expected):
+        """Test that front matter ends at the first closing fence, with CRLF files read as LF."""
+        path = tmp_path / 'post.md'
+        path.write_bytes(text.encode())
+
+        post = BlogPostParser.parse(str(path))
+
+        assert (post and (post['metadata'], post['content'])) == expected
+
+
+class TestProjectFiles:
+    """Test ProjectFileManager.get_project_files()."""
+
+    def test_lists_markdown_files_in_walk_order(self, tmp_path):
+        """Test that nested .md files are listed relative to the project, as os.walk would."""
+        project = tmp_path / 'Project'
+        (project / 'docs' / 'plans').mkdir(parents=True)
+        (project / 'README.md').write_text('readme')
+        (project / 'notes.txt').write_text('skip')
+        (project / 'docs' / 'guide.md').write_text('guide')
+        (project / 'docs' / 'plans' / 'week-1.md').write_text('plan')
+        (project / 'linked').symlink_to(project / 'docs')
+
+        expected = [
+            os.path.relpath(os.path.join(root, name), project)
+            for root, _, names in os.walk(project)
+            for name in names if name.endswith('.md')
+        ]
+        files = ProjectFileManager(str(tmp_path), ['Project']).get_project_files('Project')
+
+        assert files == expected
+        assert sorted(files) == ['README.md', 'docs/guide.md', 'docs/plans/week-1.md']
+
+    def test_file_order_ranks_listed_files_first(self, tmp_path):
+        """Test that files follow file_order, with unlisted files after in walk order."""
+        project = tmp_path / 'Project'
+        project.mkdir()
+        for name in ('a.md', 'b.md', 'c.md', 'd.md'):
+            (project / name).write_text(name)
+        manager = ProjectFileManager(str(tmp_path), ['Project'])
+        walk_order = [f for f in manager.get_project_files('Project') if f in ('a.md', 'd.md')]
+
+        files = manager.get_project_files('Project', file_order=['c.md', 'missing.md', 'b.md', 'c.md'])
+
+        assert files == ['c.md', 'b.md', *walk_order]
+
+    def test_file_content_searches_docs_then_project_root(self, tmp_path):
+        """Test that get_file_content() prefers docs/ and falls back to the project root."""
+        project = tmp_path / 'Project'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'docs' / 'plan.md').write_text('docs plan')
+        (project / 'plan.md').write_text('root plan')
+        (project / 'notes.md').write_text('root notes')
+        manager = ProjectFileManager(str(tmp_path), ['Project'])
+
+        assert manager.get_file_content('Project', 'plan.md') == 'docs plan'
+        assert manager.get_file_content('Project', 'notes.md') == 'root notes'
+
+    @pytest.mark.parametrize('file_path', [
+        '../Project_other/secret.md',
+        '../../outside.md',
+        'escape.md',
+        'docs',
+        'plan.txt',
+    ])
+    def test_file_content_stays_inside_project(self, tmp_path, file_path):
+        """Test that traversal, sibling-prefix and symlink escapes are rejected."""
+        (tmp_path / 'outside.md').write_text('outside')
+        (tmp_path / 'Project_other').mkdir()
+        (tmp_path / 'Project_other' / 'secret.md').write_text('secret')
+        project = tmp_path / 'Project'
+        (project / 'docs').mkdir(parents=True)
+        (project / 'escape.md').symlink_to(tmp_path / 'outside.md')
+        (project / 'plan.txt').write_text('not markdown')
+        manager = ProjectFileManager(str(tmp_path), ['Project'])
+
+        with pytest.raises(FileNotFoundError):
+            manager.get_file_content('Project', file_path)
+
+    def test_missing_project_directory_lists_nothing(self, tmp_path):
+        """Test that a configured project without a directory yields no files."""
+        assert ProjectFileManager(str(tmp_path), ['Missing']).get_project_files('Missing') == []
+
+
+def _categorize_by_scan(filename, content=None):
+    """Reference categorization: a plain substring test per keyword."""
+    for category, keywords in FileCategorizer.CATEGORY_KEYWORDS.items():
+        if any(kw in filename.lower() for kw in keywords):
+            return category
+    if content:
+        content_lower = content[:2000].lower()
+        scores = {}
+        for category, keywords in FileCategorizer.CATEGORY_KEYWORDS.items():
+            score = sum(1 for kw in keywords if kw in content_lower)
+            if score:
+                scores[category] = score
+        if scores:
+            return max(scores, key=scores.get)
+    return 'general'
+
+
+class TestFileCategorizer:
+    """Test FileCategorizer.categorize_file()."""
+
+    @pytest.mark.parametrize('filename, content', [
+        ('meal-plan.md', None),
+        ('blog-notes.md', None),
+        ('README.md', None),
+        ('README.md', 'My journey and vision as a developer, plus my origin story.'),
+        ('notes.md', 'Workout: 5 sets of 5 reps, then cardio. Track body fat progress weekly.'),
+        ('notes.md', 'Progressive overload for muscle; progressive overload again.'),
+        ('notes.md', 'Nothing to see here.'),
+        ('notes.md', 'Check-in: weight, measurement and progress chart; coaching session review.'),
+        ('notes.md', 'x' * 1990 + ' meal diet food'),
+    ])
+    def test_matches_keyword_scan(self, filename, content):
+        """Test that categories match a per-keyword substring scan."""
+        assert FileCategorizer.categorize_file(filename, content) == _categorize_by_scan(filename, content)
+
+    def test_read_excerpts_keeps_order(self, tmp_path):
+        """Test that excerpts come back in input order, with '' for unreadable files."""
+        names = [f'{i}.md' for i in range(3)]
+        for name in names:
+            (tmp_path / name).write_text(name * 1000)
+
+        excerpts = FileCategorizer.read_excerpts(str(tmp_path), names + ['missing.md'], size=10)
+
+        assert excerpts == [(name, (name * 1000)[:10]) for name in names] + [('missing.md', '')]
+
+    def test_project_categories_follow_preferred_order(self):
+        """Test that preferred categories come first, then the rest alphabetically, each with sorted files."""
+        categorized = FileCategorizer.categorize_project_files('Health_and_Fitness', [
+            ('story.md', None),
+            ('workout-b.md', None),
+            ('meal-plan.md', None),
+            ('workout-a.md', None),
+            ('misc.md', None),
+            ('week-1.md', None),
+        ])
+
+        assert categorized == {
+            'training': ['workout-a.md', 'workout-b.md'],
+            'nutrition': ['meal-plan.md'],
+            'general': ['misc.md'],
+            'learning': ['week-1.md'],
+            'narrative': ['story.md'],
+        }
+        assert list(categorized) == ['training', 'nutrition', 'general', 'learning', 'narrative']
+
+    def test_project_categorization_reuses_results(self, monkeypatch):
+        """Test that an unchanged (filename, excerpt) pair is only categorized once."""
+        FileCategorizer._categorize_file_cached.cache_clear()
+        categorize_file = Mock(wraps=FileCategorizer.categorize_file)
+        monkeypatch.setattr(FileCategorizer, 'categorize_file', categorize_file)
+        files = [('notes.md', 'Workout: 5 sets of 5 reps.'), ('misc.md', '')]
+
+        first = FileCategorizer.categorize_project_files('AI_Development', files)
+        second = FileCategorizer.categorize_project_files('AI_Development', files)
+        FileCategorizer.categorize_project_files('AI_Development', [('notes.md', 'Meal plan.')])
+
+        assert first == second == {'training': ['notes.md'], 'general': ['misc.md']}
+        assert categorize_file.call_count == 3
+        FileCategorizer._categorize_file_cached.cache_clear()
+
+    def test_keyword_starting_another_counts_for_both(self):
+        """Test that a match of 'progressive' also scores the shorter 'progress' keyword."""
+        _, hits = file_utils._keyword_index({'a': ['progressive'], 'b': ['progress', 'log']})
+
+        assert hits['progressive'] == (('a', 'progressive'), ('b', 'progress'))
+        assert hits['log'] == (('b', 'log'),)
+
+
+class TestHealthDataParser:
+    """Test HealthDataParser.parse_health_data()."""
+
+    def test_parses_rows_after_header(self, tmp_path):
+        """Test that numeric cells are parsed and 'None' or malformed cells skipped."""
+        log = tmp_path / 'check-in-log.md'
+        log.write_text(
+            '| Date | Weight | Body Fat |\n'
+            '|------|--------|----------|\n'
+            '| 2026-01-01 | 180.5 | 22.0 |\n'
+            '| 2026-01-08 | None | 21.5 |\n'
+            '| 2026-01-15 | 179 | n/a |\n'
+            '| 2026-01-22 | 178 |\n'
+        )
+
+        data = HealthDataParser.parse_health_data(str(log))
+
+        assert data == {
+            'weight': [{'x': '2026-01-01', 'y': 180.5}, {'x': '2026-01-15', 'y': 179.0}],
+            'bodyfat': [{'x': '2026-01-01', 'y': 22.0}, {'x': '2026-01-08', 'y': 21.5}],
+        }
+
+    def test_missing_file_returns_empty_series(self, tmp_path):
+        """Test that a missing log yields empty weight and body fat lists."""
+        assert HealthDataParser.parse_health_data(str(tmp_path / 'missing.md')) == {'weight': [], 'bodyfat': []}
+
+
+class TestFileCache:
+    """Test that parsed posts and file contents are reused until the file changes."""
+
+    def test_parse_reuses_result_until_file_changes(self, post_file, monkeypatch):
+        """Test that an unchanged post is parsed once and an edited one again."""
+        parse_file = Mock(wraps=BlogPostParser._parse_file)
+        monkeypatch.setattr(BlogPostParser, '_parse_file', parse_file)
+
+        first = BlogPostParser.parse(str(post_file))
+        assert BlogPostParser.parse(str(post_file)) is first
+        parse_file.assert_called_once()
+
+        post_file.write_text(SAMPLE_POST.replace('Progressive Overload', 'Deload Week'))
+        assert BlogPostParser.parse(str(post_file))['metadata']['title'] == 'Deload Week'
+
+    def test_file_content_reflects_edits(self, tmp_path):
+        """Test that get_file_content() returns new content after the file is edited."""
+        docs = tmp_path / 'Project' / 'docs'
+        docs.mkdir(parents=True)
+        (docs / 'plan.md').write_text('# Plan\n')
+        manager = ProjectFileManager(str(tmp_path), ['Project'])
+
+        assert manager.get_file_content('Project', 'plan.md') == '# Plan\n'
+        (docs / 'plan.md').write_text('# Plan v2\n')
+        assert manager.get_file_content('Project', 'plan.md') == '# Plan v2\n'
+
+    def test_gemini_file_reflects_edits(self, tmp_path):
+        """Test that get_gemini_file() is served from the cache but picks up edits."""
+        project = tmp_path / 'Project'
+        project.mkdir()
+        (project / 'GEMINI.md').write_text('# Overview\n')
+        manager = ProjectFileManager(str(tmp_path), ['Project'])
+
+        assert manager.get_gemini_file('Project') == '# Overview\n'
+        (project / 'GEMINI.md').write_text('# Overview v2\n')
+        assert manager.get_gemini_file('Project') == '# Overview v2\n'
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that the least recently used entries are dropped past the limit."""
+        monkeypatch.setattr(file_utils, '_FILE_CACHE_MAX_ENTRIES', 2)
+        monkeypatch.setattr(file_utils, '_file_cache', file_utils.OrderedDict())
+        paths = []
+        for name in ('a', 'b', 'c'):
+            path = tmp_path / f'{name}.md'
+            path.write_text(name)
+            paths.append(str(path))
+            file_utils._cached_by_mtime('text', str(path), file_utils._read_text)
+
+        assert list(file_utils._file_cache) == [('text', paths[1]), ('text', paths[2])]
+
+
+class TestVirtualPageCache:
+    """Test reuse of generated database-driven pages."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Data-enabled manager for a logged-in user, with a controllable data version."""
+        import flask_login
+        monkeypatch.setattr(file_utils, '_file_cache', file_utils.OrderedDict())
+        monkeypatch.setattr(flask_login, 'current_user', Mock(is_authenticated=True, id=7))
+        manager = ProjectFileManager('/nonexistent', ['Health_and_Fitness'], allow_data_access=True)
+        self.version = (3, '2026-01-06')
+        monkeypatch.setattr(ProjectFileManager, '_virtual_page_version',
+                            staticmethod(lambda file_path, user_id: self.version))
+        manager._generate_meal_log = Mock(side_effect=lambda: f'# Meal Log v{self.version[0]}')
+        return manager
+
+    def test_page_is_reused_until_version_changes(self, manager):
+        """Test that a page is only generated again after the user's rows change."""
+        def get():
+            return manager.get_file_content('Health_and_Fitness', 'data/meal-log.md')
+
+        assert get() == '# Meal Log v3'
+        assert get() == '# Meal Log v3'
+        assert manager._generate_meal_log.call_count == 1
+
+        self.version = (4, '2026-01-07')
+        assert get() == '# Meal Log v4'
+        assert manager._generate_meal_log.call_count == 2
+
+    def test_logged_out_page_is_not_cached(self, manager, monkeypatch):
+        """Test that the login prompt is generated directly without a data version."""
+        import flask_login
+        monkeypatch.setattr(flask_login, 'current_user', Mock(is_authenticated=False))
+
+        manager.get_file_content('Health_and_Fitness', 'data/meal-log.md')
+
+        assert not file_utils._file_cache
@@ -0,0 +1,50 @@
+"""
+Unit Tests for Pagination
+=========================
+
+Tests for Paginator and paginate_response().
+
+Test Coverage:
+1. Page counts and navigation flags
+2. Page contents and page ranges
+"""
+
+import pytest
+
+from website.utils.pagination import Paginator, paginate_response
+
+
+class TestPaginator:
+    """Test Paginator page counts, navigation and items."""
+
+    @pytest.mark.parametrize('total, per_page, pages', [(0, 10, 0), (1, 10, 1), (10, 10, 1), (11, 10, 2)])
+    def test_pages(self, total, per_page, pages):
+        """Test that the page count rounds up partial pages."""
+        assert Paginator(list(range(total)), per_page=per_page).pages == pages
+
+    def test_to_dict_for_middle_page(self):
+        """Test navigation fields and items for a page with neighbours on both sides."""
+        assert paginate_response(list(range(25)), page=2, per_page=10) == {
+            'page': 2,
+            'per_page': 10,
+            'total': 25,
+            'pages': 3,
+            'has_prev': True,
+            'has_next': True,
+            'prev_num': 1,
+            'next_num': 3,
+            'items': list(range(10, 20)),
+        }
+
+    def test_page_past_the_end_is_empty(self):
+        """Test that a page beyond the last one has no items or next page."""
+        paginator = Paginator(list(range(5)), per_page=2, page=4)
+
+        assert paginator.items_per_page == []
+        assert paginator.next_num is None
+
+    def test_page_range_keeps_edges_and_neighbours(self):
+        """Test that only edge pages and pages near the current one are listed."""
+        paginator = Paginator(list(range(200)), per_page=10, page=10)
+
+        assert paginator.get_page_range(1, 1, 2, 1) == [1, None, 9, 10, 11, 12, None, 20]
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Performance Monitoring
+=====================================
+
+Tests for PerformanceMonitor request timing.
+
+Test Coverage:
+1. Average request time and recent requests over the retained window
+2. Per-endpoint metrics and rankings
+3. Non-blocking system metrics
+"""
+
+import pytest
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+psutil = pytest.importorskip('psutil')
+
+from website.utils.performance import PerformanceMonitor
+
+
+class TestRequestTimes:
+    """Test PerformanceMonitor.get_average_request_time()."""
+
+    def test_average_of_empty_monitor_is_zero(self):
+        """Test that a monitor with no requests reports zero."""
+        assert PerformanceMonitor().get_average_request_time() == 0
+
+    def test_average_covers_only_retained_requests(self):
+        """Test that requests dropped from the window no longer count toward the average."""
+        monitor = PerformanceMonitor()
+        window = monitor.request_times.maxlen
+
+        for _ in range(window):
+            monitor.record_request('/api/slow', 1.0)
+        for _ in range(window):
+            monitor.record_request('/api/fast', 0.25)
+
+        assert monitor.get_average_request_time() == pytest.approx(0.25)
+        assert len(monitor.request_times) == window
+
+    def test_running_total_matches_window_under_threads(self):
+        """Test that concurrent record_request() calls keep the total equal to the retained durations."""
+        monitor = PerformanceMonitor()
+
+        def record(duration):
+            for _ in range(2000):
+                monitor.record_request('/api/threaded', duration)
+
+        threads = [threading.Thread(target=record, args=(d,)) for d in (0.1, 0.2, 0.3, 0.4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        retained = sum(duration for _, duration, _ in monitor.request_times)
+        assert monitor._request_time_total == pytest.approx(retained)
+
+    def test_recent_requests_are_formatted_on_read(self):
+        """Test that the last requests are reported oldest first with ISO timestamps."""
+        monitor = PerformanceMonitor()
+        for i in range(25):
+            monitor.record_request(f'/api/{i}', i / 100)
+
+        recent = monitor.get_recent_requests()
+
+        assert [r['endpoint'] for r in recent] == [f'/api/{i}' for i in range(5, 25)]
+        assert recent[-1]['duration'] == 0.24
+        assert datetime.fromisoformat(recent[-1]['timestamp'])
+
+
+class TestEndpointMetrics:
+    """Test per-endpoint aggregates and the slowest/most-called rankings."""
+
+    @pytest.fixture
+    def monitor(self):
+        """Monitor with three endpoints of differing speed and traffic."""
+        monitor = PerformanceMonitor()
+        for endpoint, durations in (
+            ('/api/a', [0.1, 0.3]),
+            ('/api/b', [0.5]),
+            ('/api/c', [0.05, 0.05, 0.2]),
+        ):
+            for duration in durations:
+                monitor.record_request(endpoint, duration)
+        return monitor
+
+    def test_endpoint_metrics(self, monitor):
+        """Test that count, total, min and max are tracked per endpoint."""
+        assert monitor.get_endpoint_metrics('/api/a') == {
+            'endpoint': '/api/a',
+            'count': 2,
+            'total_time': pytest.approx(0.4),
+            'avg_time': pytest.approx(0.2),
+            'min_time': 0.1,
+            'max_time': 0.3,
+        }
+        assert monitor.get_endpoint_metrics('/api/missing') is None
+        assert '/api/missing' not in monitor.endpoint_times
+
+    def test_rankings(self, monitor):
+        """Test that endpoints are ranked by average time and by call count, limited to the top N."""
+        assert [e['endpoint'] for e in monitor.get_slowest_endpoints()] == ['/api/b', '/api/a', '/api/c']
+        assert [e['endpoint'] for e in monitor.get_most_called_endpoints(limit=2)] == ['/api/c', '/api/a']
+
+
+class TestSystemMetrics:
+    """Test CPU and memory sampling."""
+
+    def test_cpu_usage_does_not_block(self, monkeypatch):
+        """Test that CPU usage is sampled without an interval, after priming at creation."""
+        cpu_percent = Mock(return_value=12.5)
+        monkeypatch.setattr(psutil, 'cpu_percent', cpu_percent)
+
+        monitor = PerformanceMonitor()
+
+        assert monitor.get_cpu_usage() == 12.5
+        assert [c.kwargs for c in cpu_percent.call_args_list] == [{'interval': None}] * 2
+
+    def test_memory_usage_reports_this_process(self):
+        """Test that memory usage is read from the monitor's own process."""
+        usage = PerformanceMonitor().get_memory_usage()
+
+        assert usage['rss_mb'] > 0
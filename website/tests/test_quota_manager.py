@@ -0,0 +1,153 @@
+"""
+Unit Tests for QuotaManager
+===========================
+
+Tests for in-memory Gemini model quota tracking.
+
+Test Coverage:
+1. Marking models exhausted and availability checks
+2. Automatic expiry once the reset time passes
+3. Next reset time / seconds until reset
+4. Status reporting
+5. Clearing state
+"""
+
+import json
+import time
+import pytest
+from datetime import datetime
+
+from website.services.quota_manager import QuotaManager
+
+
+@pytest.fixture
+def manager():
+    """Fresh QuotaManager per test (the module singleton is shared state)."""
+    return QuotaManager()
+
+
+class TestAvailability:
+    """Test mark_quota_exhausted() and is_quota_available()."""
+
+    def test_unknown_model_is_available(self, manager):
+        """Test that models never marked exhausted are available."""
+        assert manager.is_quota_available('gemini-1.5-flash') is True
+
+    def test_exhausted_model_is_unavailable(self, manager):
+        """Test that a model marked exhausted is unavailable until reset."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+
+        assert manager.is_quota_available('gemini-1.5-flash') is False
+        assert manager.is_quota_available('gemini-1.5-flash-8b') is True
+
+    def test_model_available_again_after_reset(self, manager):
+        """Test that quota becomes available once the reset time has passed."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 0)
+
+        assert manager.is_quota_available('gemini-1.5-flash') is True
+        assert manager.get_status() == {}
+
+    def test_sweeper_removes_reset_models(self, manager):
+        """Test that the background sweeper purges entries once they reset."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 0)
+
+        deadline = time.monotonic() + 2
+        while manager.has_exhausted_models and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert manager.has_exhausted_models is False
+
+    def test_reset_entry_is_removed_once(self, manager):
+        """Test that an expired entry is purged once and availability checks never remove it."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+        now = time.monotonic() + 3601
+
+        assert manager.is_quota_available('gemini-1.5-flash', now) is True
+        assert manager.has_exhausted_models is True
+
+        with manager._lock:
+            assert manager._purge_expired(now) == ['gemini-1.5-flash']
+            assert manager._purge_expired(now) == []
+
+
+class TestResetTimes:
+    """Test get_next_reset_time() and get_seconds_until_reset()."""
+
+    def test_no_reset_when_nothing_exhausted(self, manager):
+        """Test that reset queries return None with no exhausted models."""
+        assert manager.get_next_reset_time() is None
+        assert manager.get_seconds_until_reset() is None
+
+    def test_seconds_until_reset_uses_earliest_model(self, manager):
+        """Test that the earliest reset across models is reported."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+        manager.mark_quota_exhausted('gemini-1.5-flash-8b', 60)
+
+        assert 58 <= manager.get_seconds_until_reset() <= 60
+
+    def test_remarked_model_uses_latest_reset_time(self, manager):
+        """Test that re-marking a model replaces its earlier reset time."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 60)
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+
+        assert 3598 <= manager.get_seconds_until_reset() <= 3600
+
+    def test_next_reset_time_is_utc_datetime(self, manager):
+        """Test that get_next_reset_time() returns a wall-clock UTC datetime."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 60)
+
+        reset_time = manager.get_next_reset_time()
+
+        assert isinstance(reset_time, datetime)
+        assert 58 <= (reset_time - datetime.utcnow()).total_seconds() <= 60
+
+
+class TestStatus:
+    """Test get_status() and clear_all()."""
+
+    def test_status_reports_exhausted_models(self, manager):
+        """Test the status dict shape for an exhausted model."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 120)
+
+        status = manager.get_status()
+
+        assert list(status) == ['gemini-1.5-flash']
+        entry = status['gemini-1.5-flash']
+        assert entry['exhausted'] is True
+        assert entry['reset_time'].endswith('Z')
+        assert 118 <= entry['seconds_until_reset'] <= 120
+
+    def test_status_is_rebuilt_when_state_changes(self, manager):
+        """Test that get_status() picks up a newly exhausted model."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+
+        first = manager.get_status()
+        assert manager.get_status() == first
+
+        manager.mark_quota_exhausted('gemini-1.5-flash-8b', 3600)
+        second = manager.get_status()
+
+        assert set(second) == {'gemini-1.5-flash', 'gemini-1.5-flash-8b'}
+
+    def test_status_is_a_json_serializable_copy(self, manager):
+        """Test that callers get plain dicts and cannot modify the cached report."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+
+        status = manager.get_status()
+        assert json.loads(json.dumps(status)) == status
+
+        status['gemini-1.5-flash']['exhausted'] = False
+        status['gemini-1.5-flash-8b'] = {}
+
+        fresh = manager.get_status()
+        assert fresh['gemini-1.5-flash']['exhausted'] is True
+        assert list(fresh) == ['gemini-1.5-flash']
+
+    def test_clear_all_resets_state(self, manager):
+        """Test that clear_all() makes every model available again."""
+        manager.mark_quota_exhausted('gemini-1.5-flash', 3600)
+
+        manager.clear_all()
+
+        assert manager.is_quota_available('gemini-1.5-flash') is True
+        assert manager.get_seconds_until_reset() is None
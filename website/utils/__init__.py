@@ -2,19 +2,41 @@
 Utility modules for the application
 """
 
-from .file_utils import BlogPostParser, ProjectFileManager, HealthDataParser
-from .cache import SimpleCache, get_cache, cached, cache_bust, CacheStats, get_cache_stats
-from .pagination import Paginator, paginate_response, validate_pagination_params
-from .performance import PerformanceMonitor, get_performance_monitor, monitor_performance, RequestTimer
-from .error_handler import (
-    AppLogger,
-    APIError,
-    NotFoundError,
-    ValidationError,
-    ServerError,
-    handle_api_errors,
-    log_request
-)
+from .lazy import lazy_attributes
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing one utility (say SimpleCache) no
+# longer pulls in the dependencies of all the others.
+_LAZY_ATTRS = {
+    # File utilities
+    'BlogPostParser': 'file_utils',
+    'ProjectFileManager': 'file_utils',
+    'HealthDataParser': 'file_utils',
+    # Caching
+    'SimpleCache': 'cache',
+    'get_cache': 'cache',
+    'cached': 'cache',
+    'cache_bust': 'cache',
+    'CacheStats': 'cache',
+    'get_cache_stats': 'cache',
+    # Pagination
+    'Paginator': 'pagination',
+    'paginate_response': 'pagination',
+    'validate_pagination_params': 'pagination',
+    # Performance monitoring
+    'PerformanceMonitor': 'performance',
+    'get_performance_monitor': 'performance',
+    'monitor_performance': 'performance',
+    'RequestTimer': 'performance',
+    # Error handling
+    'AppLogger': 'error_handler',
+    'APIError': 'error_handler',
+    'NotFoundError': 'error_handler',
+    'ValidationError': 'error_handler',
+    'ServerError': 'error_handler',
+    'handle_api_errors': 'error_handler',
+    'log_request': 'error_handler',
+}
 
 __all__ = [
     # File utilities
@@ -46,3 +68,6 @@ __all__ = [
     'handle_api_errors',
     'log_request'
 ]
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRS)
@@ -4,11 +4,58 @@ AI Coach Function Tools
 
 Function declarations (schemas) for Gemini function calling.
 These define the structure of database records that the AI can suggest creating.
+
+Schemas are built once and returned as deep read-only views (nested
+MappingProxyType objects and tuples), so every request and thread can
+share the same instances without copying them.
 """
 
-from typing import List, Dict, Any
+from functools import cache, wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+
+# Enum values for the record-type parameters. Session and document types
+# appear in both a create schema and the matching query filter, so they
+# are defined once here to keep the two in step.
+_MEAL_TYPES = ('BREAKFAST', 'LUNCH', 'DINNER', 'SNACK', 'PRE_WORKOUT', 'POST_WORKOUT', 'OTHER')
+_SESSION_TYPES = ('STRENGTH', 'CARDIO', 'FLEXIBILITY', 'MARTIAL_ARTS', 'SPORTS', 'RECOVERY', 'MIXED')
+_BEHAVIOR_CATEGORIES = ('HEALTH', 'FITNESS', 'NUTRITION', 'LEARNING', 'PRODUCTIVITY', 'WELLNESS', 'CUSTOM')
+_DOCUMENT_TYPES = ('workout_plan', 'meal_plan', 'progress_report', 'fitness_roadmap', 'analysis', 'coaching_notes', 'educational', 'custom')
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _schema(build: Callable[[], dict]) -> Callable[[], Mapping[str, Any]]:
+    """Decorate a schema builder so it runs once and returns a frozen result."""
+    @cache
+    @wraps(build)
+    def get_schema() -> Mapping[str, Any]:
+        return _freeze(build())
+    return get_schema
 
 
+def _function_schema(
+    name: str,
+    description: str,
+    properties: Dict[str, Any],
+    required: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Wrap parameter properties in a function declaration with an object parameters block."""
+    parameters: Dict[str, Any] = {'type': 'object', 'properties': properties}
+    if required is not None:
+        parameters['required'] = required
+    return {'name': name, 'description': description, 'parameters': parameters}
+
+
+@_schema
 def create_health_metric_schema() -> Dict[str, Any]:
     """
     Function schema for creating a health metric record.
@@ -20,54 +67,52 @@ def create_health_metric_schema() -> Dict[str, Any]:
     - Wellness indicators
     - Notes
     """
-    return {
-        'name': 'create_health_metric',
-        'description': 'Create a health metric record to track weight, body fat, measurements, and wellness indicators. Use this when the user mentions their weight, body measurements, or how they\'re feeling physically.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'recorded_date': {
-                    'type': 'string',
-                    'description': 'Date of the measurement in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
-                },
-                'weight_lbs': {
-                    'type': 'number',
-                    'description': 'Weight in pounds'
-                },
-                'body_fat_percentage': {
-                    'type': 'number',
-                    'description': 'Body fat percentage (0-100)'
-                },
-                'waist_inches': {
-                    'type': 'number',
-                    'description': 'Waist measurement in inches'
-                },
-                'chest_inches': {
-                    'type': 'number',
-                    'description': 'Chest measurement in inches'
-                },
-                'energy_level': {
-                    'type': 'integer',
-                    'description': 'Energy level on a scale of 1-10'
-                },
-                'mood': {
-                    'type': 'integer',
-                    'description': 'Mood on a scale of 1-10'
-                },
-                'sleep_quality': {
-                    'type': 'integer',
-                    'description': 'Sleep quality on a scale of 1-10'
-                },
-                'notes': {
-                    'type': 'string',
-                    'description': 'Additional notes or observations'
-                }
+    return _function_schema(
+        'create_health_metric',
+        'Create a health metric record to track weight, body fat, measurements, and wellness indicators. Use this when the user mentions their weight, body measurements, or how they\'re feeling physically.',
+        {
+            'recorded_date': {
+                'type': 'string',
+                'description': 'Date of the measurement in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
             },
-            'required': ['recorded_date']
-        }
-    }
+            'weight_lbs': {
+                'type': 'number',
+                'description': 'Weight in pounds'
+            },
+            'body_fat_percentage': {
+                'type': 'number',
+                'description': 'Body fat percentage (0-100)'
+            },
+            'waist_inches': {
+                'type': 'number',
+                'description': 'Waist measurement in inches'
+            },
+            'chest_inches': {
+                'type': 'number',
+                'description': 'Chest measurement in inches'
+            },
+            'energy_level': {
+                'type': 'integer',
+                'description': 'Energy level on a scale of 1-10'
+            },
+            'mood': {
+                'type': 'integer',
+                'description': 'Mood on a scale of 1-10'
+            },
+            'sleep_quality': {
+                'type': 'integer',
+                'description': 'Sleep quality on a scale of 1-10'
+            },
+            'notes': {
+                'type': 'string',
+                'description': 'Additional notes or observations'
+            }
+        },
+        ['recorded_date'],
+    )
 
 
+@_schema
 def create_meal_log_schema() -> Dict[str, Any]:
     """
     Function schema for creating a meal log record.
@@ -77,51 +122,49 @@ def create_meal_log_schema() -> Dict[str, Any]:
     - Calories and macronutrients
     - Description of food
     """
-    return {
-        'name': 'create_meal_log',
-        'description': 'Create a meal log entry to track nutrition. Use this when the user mentions what they ate, their calories, or macros.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'meal_date': {
-                    'type': 'string',
-                    'description': 'Date of the meal in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
-                },
-                'meal_type': {
-                    'type': 'string',
-                    'enum': ['BREAKFAST', 'LUNCH', 'DINNER', 'SNACK', 'PRE_WORKOUT', 'POST_WORKOUT', 'OTHER'],
-                    'description': 'Type of meal'
-                },
-                'calories': {
-                    'type': 'integer',
-                    'description': 'Total calories consumed'
-                },
-                'protein_g': {
-                    'type': 'number',
-                    'description': 'Protein in grams'
-                },
-                'carbs_g': {
-                    'type': 'number',
-                    'description': 'Carbohydrates in grams'
-                },
-                'fat_g': {
-                    'type': 'number',
-                    'description': 'Fat in grams'
-                },
-                'fiber_g': {
-                    'type': 'number',
-                    'description': 'Fiber in grams'
-                },
-                'description': {
-                    'type': 'string',
-                    'description': 'Description of the meal or food items'
-                }
+    return _function_schema(
+        'create_meal_log',
+        'Create a meal log entry to track nutrition. Use this when the user mentions what they ate, their calories, or macros.',
+        {
+            'meal_date': {
+                'type': 'string',
+                'description': 'Date of the meal in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
             },
-            'required': ['meal_date', 'meal_type']
-        }
-    }
+            'meal_type': {
+                'type': 'string',
+                'enum': _MEAL_TYPES,
+                'description': 'Type of meal'
+            },
+            'calories': {
+                'type': 'integer',
+                'description': 'Total calories consumed'
+            },
+            'protein_g': {
+                'type': 'number',
+                'description': 'Protein in grams'
+            },
+            'carbs_g': {
+                'type': 'number',
+                'description': 'Carbohydrates in grams'
+            },
+            'fat_g': {
+                'type': 'number',
+                'description': 'Fat in grams'
+            },
+            'fiber_g': {
+                'type': 'number',
+                'description': 'Fiber in grams'
+            },
+            'description': {
+                'type': 'string',
+                'description': 'Description of the meal or food items'
+            }
+        },
+        ['meal_date', 'meal_type'],
+    )
 
 
+@_schema
 def create_workout_schema() -> Dict[str, Any]:
     """
     Function schema for creating a workout session with exercises.
@@ -132,73 +175,71 @@ def create_workout_schema() -> Dict[str, Any]:
     - List of exercises with sets, reps, weight
     - Notes
     """
-    return {
-        'name': 'create_workout',
-        'description': 'Create a workout session record with exercises. Use this when the user mentions their workout, exercises performed, or training session.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'session_date': {
-                    'type': 'string',
-                    'description': 'Date of the workout in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
-                },
-                'session_type': {
-                    'type': 'string',
-                    'enum': ['STRENGTH', 'CARDIO', 'FLEXIBILITY', 'MARTIAL_ARTS', 'SPORTS', 'RECOVERY', 'MIXED'],
-                    'description': 'Type of workout session'
-                },
-                'duration_minutes': {
-                    'type': 'integer',
-                    'description': 'Duration of workout in minutes'
-                },
-                'exercises': {
-                    'type': 'array',
-                    'description': 'List of exercises performed',
-                    'items': {
-                        'type': 'object',
-                        'properties': {
-                            'exercise_name': {
-                                'type': 'string',
-                                'description': 'Name of the exercise'
-                            },
-                            'sets': {
-                                'type': 'integer',
-                                'description': 'Number of sets performed'
-                            },
-                            'reps': {
-                                'type': 'integer',
-                                'description': 'Number of repetitions per set'
-                            },
-                            'weight_lbs': {
-                                'type': 'number',
-                                'description': 'Weight used in pounds (if applicable)'
-                            },
-                            'duration_seconds': {
-                                'type': 'integer',
-                                'description': 'Duration in seconds (for timed exercises)'
-                            },
-                            'notes': {
-                                'type': 'string',
-                                'description': 'Notes about the exercise performance'
-                            }
+    return _function_schema(
+        'create_workout',
+        'Create a workout session record with exercises. Use this when the user mentions their workout, exercises performed, or training session.',
+        {
+            'session_date': {
+                'type': 'string',
+                'description': 'Date of the workout in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
+            },
+            'session_type': {
+                'type': 'string',
+                'enum': _SESSION_TYPES,
+                'description': 'Type of workout session'
+            },
+            'duration_minutes': {
+                'type': 'integer',
+                'description': 'Duration of workout in minutes'
+            },
+            'exercises': {
+                'type': 'array',
+                'description': 'List of exercises performed',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'exercise_name': {
+                            'type': 'string',
+                            'description': 'Name of the exercise'
+                        },
+                        'sets': {
+                            'type': 'integer',
+                            'description': 'Number of sets performed'
+                        },
+                        'reps': {
+                            'type': 'integer',
+                            'description': 'Number of repetitions per set'
                         },
-                        'required': ['exercise_name']
-                    }
-                },
-                'intensity_level': {
-                    'type': 'integer',
-                    'description': 'Perceived exertion level (1-10)'
-                },
-                'notes': {
-                    'type': 'string',
-                    'description': 'General notes about the workout session'
+                        'weight_lbs': {
+                            'type': 'number',
+                            'description': 'Weight used in pounds (if applicable)'
+                        },
+                        'duration_seconds': {
+                            'type': 'integer',
+                            'description': 'Duration in seconds (for timed exercises)'
+                        },
+                        'notes': {
+                            'type': 'string',
+                            'description': 'Notes about the exercise performance'
+                        }
+                    },
+                    'required': ['exercise_name']
                 }
             },
-            'required': ['session_date', 'session_type']
-        }
-    }
+            'intensity_level': {
+                'type': 'integer',
+                'description': 'Perceived exertion level (1-10)'
+            },
+            'notes': {
+                'type': 'string',
+                'description': 'General notes about the workout session'
+            }
+        },
+        ['session_date', 'session_type'],
+    )
 
 
+@_schema
 def create_coaching_session_schema() -> Dict[str, Any]:
     """
     Function schema for creating a coaching session record.
@@ -209,37 +250,35 @@ def create_coaching_session_schema() -> Dict[str, Any]:
     - Coach feedback
     - Action items
     """
-    return {
-        'name': 'create_coaching_session',
-        'description': 'Create a coaching session record to capture our discussion, feedback, and action items. Use this when wrapping up a coaching conversation or when the user wants to save our discussion.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'session_date': {
-                    'type': 'string',
-                    'description': 'Date of the coaching session in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
-                },
-                'discussion_notes': {
-                    'type': 'string',
-                    'description': 'Summary of topics discussed during the session'
-                },
-                'coach_feedback': {
-                    'type': 'string',
-                    'description': 'Coach\'s feedback, observations, and recommendations'
-                },
-                'action_items': {
-                    'type': 'array',
-                    'description': 'List of action items or tasks for the client',
-                    'items': {
-                        'type': 'string'
-                    }
-                }
+    return _function_schema(
+        'create_coaching_session',
+        'Create a coaching session record to capture our discussion, feedback, and action items. Use this when wrapping up a coaching conversation or when the user wants to save our discussion.',
+        {
+            'session_date': {
+                'type': 'string',
+                'description': 'Date of the coaching session in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
             },
-            'required': ['session_date']
-        }
-    }
+            'discussion_notes': {
+                'type': 'string',
+                'description': 'Summary of topics discussed during the session'
+            },
+            'coach_feedback': {
+                'type': 'string',
+                'description': 'Coach\'s feedback, observations, and recommendations'
+            },
+            'action_items': {
+                'type': 'array',
+                'description': 'List of action items or tasks for the client',
+                'items': {
+                    'type': 'string'
+                }
+            }
+        },
+        ['session_date'],
+    )
 
 
+@_schema
 def get_recent_health_metrics_schema() -> Dict[str, Any]:
     """
     Function schema for querying recent health metrics.
@@ -247,311 +286,299 @@ def get_recent_health_metrics_schema() -> Dict[str, Any]:
     Allows AI to READ historical health data including weight, body fat,
     measurements, and wellness indicators.
     """
-    return {
-        'name': 'get_recent_health_metrics',
-        'description': 'Query recent health metrics including weight, body fat percentage, measurements, and wellness indicators. Use this when you need to reference the user\'s progress, trends, or current stats.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'days': {
-                    'type': 'integer',
-                    'description': 'Number of days to look back (default: 7, max: 90)',
-                },
-                'include_trends': {
-                    'type': 'boolean',
-                    'description': 'Whether to include trend calculations (weight change, averages)',
-                }
+    return _function_schema(
+        'get_recent_health_metrics',
+        'Query recent health metrics including weight, body fat percentage, measurements, and wellness indicators. Use this when you need to reference the user\'s progress, trends, or current stats.',
+        {
+            'days': {
+                'type': 'integer',
+                'description': 'Number of days to look back (default: 7, max: 90)',
+            },
+            'include_trends': {
+                'type': 'boolean',
+                'description': 'Whether to include trend calculations (weight change, averages)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_workout_history_schema() -> Dict[str, Any]:
     """
     Function schema for querying recent workout sessions.
 
     Allows AI to READ workout history including session details and exercises.
     """
-    return {
-        'name': 'get_workout_history',
-        'description': 'Query recent workout sessions including type, duration, exercises, and performance. Use this when discussing training progress, consistency, or planning future workouts.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'days': {
-                    'type': 'integer',
-                    'description': 'Number of days to look back (default: 7, max: 30)',
-                },
-                'session_type': {
-                    'type': 'string',
-                    'enum': ['STRENGTH', 'CARDIO', 'FLEXIBILITY', 'MARTIAL_ARTS', 'SPORTS', 'RECOVERY', 'MIXED'],
-                    'description': 'Optional filter by session type'
-                },
-                'include_exercises': {
-                    'type': 'boolean',
-                    'description': 'Whether to include exercise details (sets, reps, weight)',
-                }
+    return _function_schema(
+        'get_workout_history',
+        'Query recent workout sessions including type, duration, exercises, and performance. Use this when discussing training progress, consistency, or planning future workouts.',
+        {
+            'days': {
+                'type': 'integer',
+                'description': 'Number of days to look back (default: 7, max: 30)',
+            },
+            'session_type': {
+                'type': 'string',
+                'enum': _SESSION_TYPES,
+                'description': 'Optional filter by session type'
+            },
+            'include_exercises': {
+                'type': 'boolean',
+                'description': 'Whether to include exercise details (sets, reps, weight)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_nutrition_summary_schema() -> Dict[str, Any]:
     """
     Function schema for querying nutrition data and adherence.
 
     Allows AI to READ meal logs, macros, and adherence patterns.
     """
-    return {
-        'name': 'get_nutrition_summary',
-        'description': 'Query nutrition data including meals, macros, calories, and adherence to plan. Use this when discussing diet, meal planning, or nutritional progress.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'days': {
-                    'type': 'integer',
-                    'description': 'Number of days to look back (default: 7, max: 30)',
-                },
-                'summary_type': {
-                    'type': 'string',
-                    'enum': ['daily', 'weekly'],
-                    'description': 'Summarize data by day or week (default: weekly)',
-                }
+    return _function_schema(
+        'get_nutrition_summary',
+        'Query nutrition data including meals, macros, calories, and adherence to plan. Use this when discussing diet, meal planning, or nutritional progress.',
+        {
+            'days': {
+                'type': 'integer',
+                'description': 'Number of days to look back (default: 7, max: 30)',
+            },
+            'summary_type': {
+                'type': 'string',
+                'enum': ['daily', 'weekly'],
+                'description': 'Summarize data by day or week (default: weekly)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_user_goals_schema() -> Dict[str, Any]:
     """
     Function schema for querying user goals and progress.
 
     Allows AI to READ active goals, targets, and progress tracking.
     """
-    return {
-        'name': 'get_user_goals',
-        'description': 'Query user\'s fitness and health goals including targets, progress, and completion status. Use this when discussing goal setting, progress toward targets, or motivation.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'status': {
-                    'type': 'string',
-                    'enum': ['active', 'completed', 'all'],
-                    'description': 'Filter by goal status (default: active)',
-                }
+    return _function_schema(
+        'get_user_goals',
+        'Query user\'s fitness and health goals including targets, progress, and completion status. Use this when discussing goal setting, progress toward targets, or motivation.',
+        {
+            'status': {
+                'type': 'string',
+                'enum': ['active', 'completed', 'all'],
+                'description': 'Filter by goal status (default: active)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_coaching_history_schema() -> Dict[str, Any]:
     """
     Function schema for querying previous coaching sessions.
 
     Allows AI to READ past coaching notes, feedback, and action items.
     """
-    return {
-        'name': 'get_coaching_history',
-        'description': 'Query previous coaching sessions including discussion notes, feedback, and action items. Use this to reference past conversations, follow up on previous advice, or check on assigned tasks.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'limit': {
-                    'type': 'integer',
-                    'description': 'Number of sessions to retrieve (default: 5, max: 20)',
-                }
+    return _function_schema(
+        'get_coaching_history',
+        'Query previous coaching sessions including discussion notes, feedback, and action items. Use this to reference past conversations, follow up on previous advice, or check on assigned tasks.',
+        {
+            'limit': {
+                'type': 'integer',
+                'description': 'Number of sessions to retrieve (default: 5, max: 20)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_progress_summary_schema() -> Dict[str, Any]:
     """
     Function schema for getting comprehensive progress overview.
 
     Allows AI to READ aggregated metrics across all data types.
     """
-    return {
-        'name': 'get_progress_summary',
-        'description': 'Get comprehensive progress overview including weight change, workout consistency, nutrition adherence, and goal progress. Use this for weekly check-ins or overall progress discussions.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'period_days': {
-                    'type': 'integer',
-                    'description': 'Analysis period in days (default: 30, max: 90)',
-                }
+    return _function_schema(
+        'get_progress_summary',
+        'Get comprehensive progress overview including weight change, workout consistency, nutrition adherence, and goal progress. Use this for weekly check-ins or overall progress discussions.',
+        {
+            'period_days': {
+                'type': 'integer',
+                'description': 'Analysis period in days (default: 30, max: 90)',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def create_behavior_definition_schema() -> Dict[str, Any]:
     """
     Function schema for creating a behavior definition.
 
     Allows AI to create new trackable behavior categories for the user.
     """
-    return {
-        'name': 'create_behavior_definition',
-        'description': 'Create a new behavior definition for tracking daily habits or routines. Use this when the user wants to track a new habit, routine, or behavior. Examples: morning meditation, reading, cold shower, journaling.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'name': {
-                    'type': 'string',
-                    'description': 'Name of the behavior (e.g., "Morning Meditation", "Read 20 Pages")'
-                },
-                'description': {
-                    'type': 'string',
-                    'description': 'Optional description or details about the behavior'
-                },
-                'category': {
-                    'type': 'string',
-                    'enum': ['HEALTH', 'FITNESS', 'NUTRITION', 'LEARNING', 'PRODUCTIVITY', 'WELLNESS', 'CUSTOM'],
-                    'description': 'Category of the behavior',
-                },
-                'icon': {
-                    'type': 'string',
-                    'description': 'Bootstrap icon class (e.g., "bi-book", "bi-heart", "bi-lightning"). See https://icons.getbootstrap.com/',
-                },
-                'color': {
-                    'type': 'string',
-                    'description': 'Hex color code for the behavior (e.g., "#4A90E2", "#E27D60")',
-                },
-                'target_frequency': {
-                    'type': 'integer',
-                    'description': 'Target number of days per week to complete this behavior (1-7)',
-                }
+    return _function_schema(
+        'create_behavior_definition',
+        'Create a new behavior definition for tracking daily habits or routines. Use this when the user wants to track a new habit, routine, or behavior. Examples: morning meditation, reading, cold shower, journaling.',
+        {
+            'name': {
+                'type': 'string',
+                'description': 'Name of the behavior (e.g., "Morning Meditation", "Read 20 Pages")'
             },
-            'required': ['name']
-        }
-    }
+            'description': {
+                'type': 'string',
+                'description': 'Optional description or details about the behavior'
+            },
+            'category': {
+                'type': 'string',
+                'enum': _BEHAVIOR_CATEGORIES,
+                'description': 'Category of the behavior',
+            },
+            'icon': {
+                'type': 'string',
+                'description': 'Bootstrap icon class (e.g., "bi-book", "bi-heart", "bi-lightning"). See https://icons.getbootstrap.com/',
+            },
+            'color': {
+                'type': 'string',
+                'description': 'Hex color code for the behavior (e.g., "#4A90E2", "#E27D60")',
+            },
+            'target_frequency': {
+                'type': 'integer',
+                'description': 'Target number of days per week to complete this behavior (1-7)',
+            }
+        },
+        ['name'],
+    )
 
 
+@_schema
 def log_behavior_schema() -> Dict[str, Any]:
     """
     Function schema for logging behavior completion.
 
     Allows AI to mark behaviors as completed for a specific date.
     """
-    return {
-        'name': 'log_behavior',
-        'description': 'Log completion of a behavior for a specific date. Use this when the user mentions they completed a tracked behavior or wants to mark something as done.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'behavior_name': {
-                    'type': 'string',
-                    'description': 'Name of the behavior to log (must match an existing behavior definition)'
-                },
-                'tracked_date': {
-                    'type': 'string',
-                    'description': 'Date of completion in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
-                },
-                'completed': {
-                    'type': 'boolean',
-                    'description': 'Whether the behavior was completed (true) or not (false)',
-                },
-                'notes': {
-                    'type': 'string',
-                    'description': 'Optional notes about the behavior completion'
-                }
+    return _function_schema(
+        'log_behavior',
+        'Log completion of a behavior for a specific date. Use this when the user mentions they completed a tracked behavior or wants to mark something as done.',
+        {
+            'behavior_name': {
+                'type': 'string',
+                'description': 'Name of the behavior to log (must match an existing behavior definition)'
             },
-            'required': ['behavior_name', 'tracked_date']
-        }
-    }
+            'tracked_date': {
+                'type': 'string',
+                'description': 'Date of completion in ISO format (YYYY-MM-DD). Use today\'s date if not specified.'
+            },
+            'completed': {
+                'type': 'boolean',
+                'description': 'Whether the behavior was completed (true) or not (false)',
+            },
+            'notes': {
+                'type': 'string',
+                'description': 'Optional notes about the behavior completion'
+            }
+        },
+        ['behavior_name', 'tracked_date'],
+    )
 
 
+@_schema
 def get_behavior_tracking_schema() -> Dict[str, Any]:
     """
     Function schema for querying behavior tracking data.
 
     Allows AI to READ behavior completion history, streaks, and patterns.
     """
-    return {
-        'name': 'get_behavior_tracking',
-        'description': 'Query behavior tracking data including completion history, current streaks, and adherence patterns. Use this when discussing habits, consistency, or progress on tracked behaviors.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'days': {
-                    'type': 'integer',
-                    'description': 'Number of days to look back (default: 7, max: 30)',
-                },
-                'behavior_name': {
-                    'type': 'string',
-                    'description': 'Optional filter for a specific behavior by name. If omitted, returns data for all behaviors.'
-                }
+    return _function_schema(
+        'get_behavior_tracking',
+        'Query behavior tracking data including completion history, current streaks, and adherence patterns. Use this when discussing habits, consistency, or progress on tracked behaviors.',
+        {
+            'days': {
+                'type': 'integer',
+                'description': 'Number of days to look back (default: 7, max: 30)',
+            },
+            'behavior_name': {
+                'type': 'string',
+                'description': 'Optional filter for a specific behavior by name. If omitted, returns data for all behaviors.'
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_behavior_plan_compliance_schema() -> Dict[str, Any]:
     """
     Function schema for querying behavior plan compliance.
 
     Allows AI to READ adherence to target frequencies and identify gaps.
     """
-    return {
-        'name': 'get_behavior_plan_compliance',
-        'description': 'Analyze behavior plan compliance by comparing actual completion frequency against target frequency. Use this when checking if the user is staying on track with their habits or when they ask about their consistency.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'period': {
-                    'type': 'string',
-                    'enum': ['week', 'month'],
-                    'description': 'Analysis period (default: week)',
-                },
-                'include_recommendations': {
-                    'type': 'boolean',
-                    'description': 'Whether to include AI-generated recommendations for improvement',
-                }
+    return _function_schema(
+        'get_behavior_plan_compliance',
+        'Analyze behavior plan compliance by comparing actual completion frequency against target frequency. Use this when checking if the user is staying on track with their habits or when they ask about their consistency.',
+        {
+            'period': {
+                'type': 'string',
+                'enum': ['week', 'month'],
+                'description': 'Analysis period (default: week)',
+            },
+            'include_recommendations': {
+                'type': 'boolean',
+                'description': 'Whether to include AI-generated recommendations for improvement',
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def create_batch_records_schema() -> Dict[str, Any]:
     """
     Function schema for creating multiple records at once.
 
     Allows the AI to create workout, meal, health metric, and other records
-    in a single function call when the user mentions multiple items.
-    """
-    return {
-        'name': 'create_batch_records',
-        'description': 'Create multiple records at once (workouts, meals, health metrics, etc.) in a single operation. Use this when the user mentions multiple things to log in one message, such as "I did a workout and ate breakfast" or "I weighed myself and logged my meals today".',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'records': {
-                    'type': 'array',
-                    'description': 'Array of records to create. Each record specifies its type and data.',
-                    'items': {
-                        'type': 'object',
-                        'properties': {
-                            'record_type': {
-                                'type': 'string',
-                                'enum': ['health_metric', 'meal_log', 'workout', 'coaching_session', 'behavior_definition', 'behavior_log'],
-                                'description': 'Type of record to create'
-                            },
-                            'data': {
-                                'type': 'object',
-                                'description': 'Record data. Structure should match the schema for the specified record_type. For health_metric: include recorded_date, weight_lbs, body_fat_percentage, etc. For meal_log: include meal_date, meal_type, calories, protein_g, etc. For workout: include session_date, session_type, duration_minutes, exercises array. For coaching_session: include session_date, discussion_notes, coach_feedback. For behavior_definition: include name, category, description. For behavior_log: include tracked_date, behavior_name, completed.'
-                            }
+    in a single function call when the user mentions multiple items. Each
+    record's data is an anyOf over the parameters of the single-record
+    schemas, so the field lists aren't repeated here as prose.
+    """
+    data_variants = {
+        'health_metric': create_health_metric_schema(),
+        'meal_log': create_meal_log_schema(),
+        'workout': create_workout_schema(),
+        'coaching_session': create_coaching_session_schema(),
+        'behavior_definition': create_behavior_definition_schema(),
+        'behavior_log': log_behavior_schema(),
+    }
+    return _function_schema(
+        'create_batch_records',
+        'Create multiple records at once (workouts, meals, health metrics, etc.) in a single operation. Use this when the user mentions multiple things to log in one message, such as "I did a workout and ate breakfast" or "I weighed myself and logged my meals today".',
+        {
+            'records': {
+                'type': 'array',
+                'description': 'Array of records to create. Each record specifies its type and data.',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'record_type': {
+                            'type': 'string',
+                            'enum': list(data_variants),
+                            'description': 'Type of record to create'
                         },
-                        'required': ['record_type', 'data']
-                    }
+                        'data': {
+                            'description': 'Record data, matching the parameters of the create function for record_type',
+                            'anyOf': [schema['parameters'] for schema in data_variants.values()]
+                        }
+                    },
+                    'required': ['record_type', 'data']
                 }
-            },
-            'required': ['records']
-        }
-    }
+            }
+        },
+        ['records'],
+    )
 
 
+@_schema
 def create_document_schema() -> Dict[str, Any]:
     """
     Function schema for creating a document.
@@ -559,131 +586,132 @@ def create_document_schema() -> Dict[str, Any]:
     Allows AI to create workout plans, meal plans, progress reports,
     and other structured documents that can be saved and referenced later.
     """
-    return {
-        'name': 'create_document',
-        'description': 'Create a document such as a workout plan, meal plan, progress report, fitness roadmap, or analysis document. Use this when the user asks you to create, write, or generate a plan, report, or document that should be saved for future reference.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'title': {
-                    'type': 'string',
-                    'description': 'Title of the document (e.g., "12-Week Strength Program", "January Progress Report")'
-                },
-                'document_type': {
-                    'type': 'string',
-                    'enum': ['workout_plan', 'meal_plan', 'progress_report', 'fitness_roadmap', 'analysis', 'coaching_notes', 'educational', 'custom'],
-                    'description': 'Type of document being created'
-                },
-                'content': {
-                    'type': 'string',
-                    'description': 'Full markdown content of the document. Use proper markdown formatting with headers (##), lists, tables, bold, etc.'
-                },
-                'summary': {
-                    'type': 'string',
-                    'description': 'Brief summary of the document (1-2 sentences, max 500 chars)'
-                },
-                'tags': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Tags for categorization (e.g., ["strength", "beginner", "4-week"])'
-                },
-                'metadata': {
-                    'type': 'object',
-                    'description': 'Optional metadata object with type-specific fields (e.g., {"duration_weeks": 12, "difficulty": "intermediate"})'
-                }
+    return _function_schema(
+        'create_document',
+        'Create a document such as a workout plan, meal plan, progress report, fitness roadmap, or analysis document. Use this when the user asks you to create, write, or generate a plan, report, or document that should be saved for future reference.',
+        {
+            'title': {
+                'type': 'string',
+                'description': 'Title of the document (e.g., "12-Week Strength Program", "January Progress Report")'
             },
-            'required': ['title', 'document_type', 'content']
-        }
-    }
+            'document_type': {
+                'type': 'string',
+                'enum': _DOCUMENT_TYPES,
+                'description': 'Type of document being created'
+            },
+            'content': {
+                'type': 'string',
+                'description': 'Full markdown content of the document. Use proper markdown formatting with headers (##), lists, tables, bold, etc.'
+            },
+            'summary': {
+                'type': 'string',
+                'description': 'Brief summary of the document (1-2 sentences, max 500 chars)'
+            },
+            'tags': {
+                'type': 'array',
+                'items': {'type': 'string'},
+                'description': 'Tags for categorization (e.g., ["strength", "beginner", "4-week"])'
+            },
+            'metadata': {
+                'type': 'object',
+                'description': 'Optional metadata object with type-specific fields (e.g., {"duration_weeks": 12, "difficulty": "intermediate"})'
+            }
+        },
+        ['title', 'document_type', 'content'],
+    )
 
 
+@_schema
 def get_documents_schema() -> Dict[str, Any]:
     """
     Function schema for querying user's documents.
 
     Allows AI to READ list of user's saved documents.
     """
-    return {
-        'name': 'get_documents',
-        'description': 'Query the user\'s saved documents (workout plans, meal plans, progress reports, etc.). Use this when the user asks about their existing plans, wants to see what documents they have, or when you need to reference a previous plan.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'document_type': {
-                    'type': 'string',
-                    'enum': ['workout_plan', 'meal_plan', 'progress_report', 'fitness_roadmap', 'analysis', 'coaching_notes', 'educational', 'custom'],
-                    'description': 'Filter by document type. If omitted, returns all types.'
-                },
-                'limit': {
-                    'type': 'integer',
-                    'description': 'Maximum number of documents to return (default: 10, max: 20)'
-                },
-                'include_content': {
-                    'type': 'boolean',
-                    'description': 'Whether to include full document content (default: false for lists, use get_document_content for full content)'
-                }
+    return _function_schema(
+        'get_documents',
+        'Query the user\'s saved documents (workout plans, meal plans, progress reports, etc.). Use this when the user asks about their existing plans, wants to see what documents they have, or when you need to reference a previous plan.',
+        {
+            'document_type': {
+                'type': 'string',
+                'enum': _DOCUMENT_TYPES,
+                'description': 'Filter by document type. If omitted, returns all types.'
+            },
+            'limit': {
+                'type': 'integer',
+                'description': 'Maximum number of documents to return (default: 10, max: 20)'
+            },
+            'include_content': {
+                'type': 'boolean',
+                'description': 'Whether to include full document content (default: false for lists, use get_document_content for full content)'
             }
-        }
-    }
+        },
+    )
 
 
+@_schema
 def get_document_content_schema() -> Dict[str, Any]:
     """
     Function schema for retrieving a specific document's content.
 
     Allows AI to READ full content of a specific document.
     """
-    return {
-        'name': 'get_document_content',
-        'description': 'Get the full content of a specific document. Use this when the user asks to see a specific plan, wants you to review a document, or needs to reference the details of a saved document.',
-        'parameters': {
-            'type': 'object',
-            'properties': {
-                'document_id': {
-                    'type': 'integer',
-                    'description': 'ID of the document to retrieve'
-                },
-                'title': {
-                    'type': 'string',
-                    'description': 'Title of the document to retrieve (use if document_id is not known)'
-                }
+    return _function_schema(
+        'get_document_content',
+        'Get the full content of a specific document. Use this when the user asks to see a specific plan, wants you to review a document, or needs to reference the details of a saved document.',
+        {
+            'document_id': {
+                'type': 'integer',
+                'description': 'ID of the document to retrieve'
+            },
+            'title': {
+                'type': 'string',
+                'description': 'Title of the document to retrieve (use if document_id is not known)'
             }
-        }
-    }
-
-
-def get_all_function_declarations() -> List[Dict[str, Any]]:
+        },
+    )
+
+
+# Declarations sent with every chat request, built once at import time.
+# The schema functions above are cached, so these share the same objects.
+_ALL_DECLARATIONS = (
+    # WRITE operations (create records)
+    # create_batch_records_schema(),  # TEMPORARILY DISABLED - schema too complex for Gemini
+    create_health_metric_schema(),
+    create_meal_log_schema(),
+    create_workout_schema(),
+    create_coaching_session_schema(),
+    create_behavior_definition_schema(),
+    log_behavior_schema(),
+    create_document_schema(),
+    # READ operations (query data)
+    get_recent_health_metrics_schema(),
+    get_workout_history_schema(),
+    get_nutrition_summary_schema(),
+    get_user_goals_schema(),
+    get_coaching_history_schema(),
+    get_progress_summary_schema(),
+    get_behavior_tracking_schema(),
+    get_behavior_plan_compliance_schema(),
+    get_documents_schema(),
+    get_document_content_schema()
+)
+
+# Name -> schema dispatch table for get_function_schema_by_name()
+_SCHEMAS_BY_NAME: Dict[str, Mapping[str, Any]] = {schema['name']: schema for schema in _ALL_DECLARATIONS}
+
+
+def get_all_function_declarations() -> List[Mapping[str, Any]]:
     """
     Get all function declarations for Gemini function calling.
 
     Returns:
-        List of function schema dictionaries
-    """
-    return [
-        # WRITE operations (create records)
-        # create_batch_records_schema(),  # TEMPORARILY DISABLED - schema too complex for Gemini
-        create_health_metric_schema(),
-        create_meal_log_schema(),
-        create_workout_schema(),
-        create_coaching_session_schema(),
-        create_behavior_definition_schema(),
-        log_behavior_schema(),
-        create_document_schema(),
-        # READ operations (query data)
-        get_recent_health_metrics_schema(),
-        get_workout_history_schema(),
-        get_nutrition_summary_schema(),
-        get_user_goals_schema(),
-        get_coaching_history_schema(),
-        get_progress_summary_schema(),
-        get_behavior_tracking_schema(),
-        get_behavior_plan_compliance_schema(),
-        get_documents_schema(),
-        get_document_content_schema()
-    ]
-
-
-def get_function_schema_by_name(function_name: str) -> Dict[str, Any]:
+        List of read-only function schema mappings
+    """
+    return list(_ALL_DECLARATIONS)
+
+
+def get_function_schema_by_name(function_name: str) -> Mapping[str, Any]:
     """
     Get a specific function schema by name.
 
@@ -691,34 +719,12 @@ def get_function_schema_by_name(function_name: str) -> Dict[str, Any]:
         function_name: Name of the function
 
     Returns:
-        Function schema dictionary
+        Read-only function schema mapping
 
     Raises:
         ValueError: If function name is not found
     """
-    schemas = {
-        # WRITE operations
-        'create_health_metric': create_health_metric_schema(),
-        'create_meal_log': create_meal_log_schema(),
-        'create_workout': create_workout_schema(),
-        'create_coaching_session': create_coaching_session_schema(),
-        'create_behavior_definition': create_behavior_definition_schema(),
-        'log_behavior': log_behavior_schema(),
-        'create_document': create_document_schema(),
-        # READ operations
-        'get_recent_health_metrics': get_recent_health_metrics_schema(),
-        'get_workout_history': get_workout_history_schema(),
-        'get_nutrition_summary': get_nutrition_summary_schema(),
-        'get_user_goals': get_user_goals_schema(),
-        'get_coaching_history': get_coaching_history_schema(),
-        'get_progress_summary': get_progress_summary_schema(),
-        'get_behavior_tracking': get_behavior_tracking_schema(),
-        'get_behavior_plan_compliance': get_behavior_plan_compliance_schema(),
-        'get_documents': get_documents_schema(),
-        'get_document_content': get_document_content_schema()
-    }
-
-    if function_name not in schemas:
-        raise ValueError(f"Unknown function: {function_name}")
-
-    return schemas[function_name]
+    try:
+        return _SCHEMAS_BY_NAME[function_name]
+    except KeyError:
+        raise ValueError(f"Unknown function: {function_name}") from None
@@ -3,89 +3,205 @@ Caching utilities for improved performance
 """
 
 import time
+import heapq
 import json
 import threading
+from collections import OrderedDict, defaultdict
 from functools import wraps
+from itertools import islice
 from typing import Callable, Any, Optional
 
 
+# Number of values serialized to estimate get_stats()['size_bytes']
+_STATS_SAMPLE_SIZE = 32
+
+# Most expired entries dropped by one get()/set(), so no single call pays
+# for a large backlog
+_SWEEP_BUDGET = 32
+
+
 class SimpleCache:
-    """Simple in-memory cache implementation"""
+    """
+    Simple in-memory cache, bounded to max_entries with LRU eviction.
+
+    Safe to share between request threads: every read and write of the
+    underlying dicts happens under one per-instance lock. If a CacheStats
+    is given, get() records each hit and miss under the same lock.
+
+    Keys of the form 'prefix:rest' (as built by cached()) are also indexed
+    by prefix, so delete_prefix() only touches the matching entries.
+
+    Expiry times are also kept in a min-heap. Each get() and set() drops a
+    few entries whose time has passed, so expired entries don't stay
+    resident until someone happens to read them.
+    """
 
-    def __init__(self, default_timeout=300):
-        self.cache = {}
+    def __init__(self, default_timeout=300, max_entries=10_000, stats: Optional['CacheStats'] = None):
+        self.cache = OrderedDict()
         self.timeouts = {}
         self.default_timeout = default_timeout
+        self.max_entries = max_entries
+        self.stats = stats
+        self._by_prefix = defaultdict(set)
+        self._expiry_heap = []
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
+        with self._lock:
+            self._sweep_expired(time.time())
+            value = self._get(key)
+            if self.stats is not None:
+                if value is None:
+                    self.stats.record_miss()
+                else:
+                    self.stats.record_hit()
+            return value
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Look up a live entry; caller holds the lock"""
         if key not in self.cache:
             return None
 
         # Check if expired
         if key in self.timeouts:
             if time.time() > self.timeouts[key]:
-                del self.cache[key]
-                del self.timeouts[key]
+                self._remove(key)
                 return None
 
+        self.cache.move_to_end(key)
         return self.cache[key]
 
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
-        """Set value in cache"""
-        self.cache[key] = value
+        """Set value in cache, evicting the least recently used entry when full"""
         if timeout is None:
             timeout = self.default_timeout
 
-        if timeout > 0:
-            self.timeouts[key] = time.time() + timeout
+        with self._lock:
+            now = time.time()
+            self._sweep_expired(now)
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            if timeout > 0:
+                expires_at = now + timeout
+                self.timeouts[key] = expires_at
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+            else:
+                self.timeouts.pop(key, None)
+
+            prefix, sep, _ = key.partition(':')
+            if sep:
+                self._by_prefix[prefix].add(key)
+
+            if len(self.cache) > self.max_entries:
+                self._remove(next(iter(self.cache)))
 
     def delete(self, key: str) -> None:
         """Delete value from cache"""
-        if key in self.cache:
-            del self.cache[key]
-        if key in self.timeouts:
-            del self.timeouts[key]
+        with self._lock:
+            self._remove(key)
+
+    def delete_matching(self, key_pattern: str) -> int:
+        """Delete every entry whose key contains key_pattern; returns the count"""
+        with self._lock:
+            keys_to_delete = [k for k in self.cache if key_pattern in k]
+            for key in keys_to_delete:
+                self._remove(key)
+        return len(keys_to_delete)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every entry whose key starts with 'prefix:'; returns the count.
+
+        The index is keyed on the part before the first ':', so a nested
+        prefix such as 'api:posts' scans the 'api' bucket for matches.
+        """
+        with self._lock:
+            head, sep, _ = prefix.partition(':')
+            if sep:
+                start = prefix + ':'
+                keys_to_delete = [k for k in self._by_prefix.get(head, ()) if k.startswith(start)]
+            else:
+                keys_to_delete = list(self._by_prefix.get(prefix, ()))
+            for key in keys_to_delete:
+                self._remove(key)
+        return len(keys_to_delete)
 
     def clear(self) -> None:
         """Clear all cache"""
-        self.cache.clear()
-        self.timeouts.clear()
+        with self._lock:
+            self.cache.clear()
+            self.timeouts.clear()
+            self._by_prefix.clear()
+            self._expiry_heap.clear()
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop up to _SWEEP_BUDGET expired entries; caller holds the lock"""
+        heap = self._expiry_heap
+        for _ in range(_SWEEP_BUDGET):
+            if not heap or heap[0][0] >= now:
+                break
+            expires_at, key = heapq.heappop(heap)
+            # Skip heap records left behind by a re-set or delete of the key
+            if self.timeouts.get(key) == expires_at:
+                self._remove(key)
+
+        # Re-sets and deletes leave records that only pop once their old
+        # expiry passes; rebuild from the live timeouts if they pile up
+        if len(heap) > 2 * len(self.timeouts) + _SWEEP_BUDGET:
+            self._expiry_heap = [(expires_at, key) for key, expires_at in self.timeouts.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry, its expiry and its prefix index; caller holds the lock"""
+        self.cache.pop(key, None)
+        self.timeouts.pop(key, None)
+        prefix, sep, _ = key.partition(':')
+        keys = self._by_prefix.get(prefix) if sep else None
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_prefix[prefix]
 
     def get_stats(self) -> dict:
-        """Get cache statistics"""
+        """
+        Get cache statistics.
+
+        size_bytes is estimated from the JSON size of up to 32 values rather
+        than serializing the whole cache on every stats request.
+        """
+        with self._lock:
+            entries = len(self.cache)
+            timeout_entries = len(self.timeouts)
+            values = list(islice(self.cache.values(), _STATS_SAMPLE_SIZE))
+
+        sample = [len(json.dumps(v, default=str)) for v in values]
         return {
-            'entries': len(self.cache),
-            'timeout_entries': len(self.timeouts),
-            'size_bytes': sum(len(json.dumps(v)) for v in self.cache.values())
+            'entries': entries,
+            'timeout_entries': timeout_entries,
+            'max_entries': self.max_entries,
+            'size_bytes': sum(sample) * entries // len(sample) if sample else 0
         }
 
 
-# Global cache instance (thread-safe)
-_cache = None
-_cache_lock = threading.Lock()
-
-
-def get_cache(timeout=300):
-    """Get or create global cache instance (thread-safe)"""
-    global _cache
-    if _cache is None:
-        with _cache_lock:
-            if _cache is None:
-                _cache = SimpleCache(default_timeout=timeout)
-    return _cache
-
-
 def cached(timeout=300, key_prefix=''):
     """Decorator for caching function results"""
 
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            cache = get_cache(timeout)
+            cache = get_cache()
 
-            # Generate cache key from function name, args, and kwargs
-            cache_key = f"{key_prefix or f.__name__}:{json.dumps([args, kwargs], sort_keys=True, default=str)}"
+            # Generate cache key from function name, args, and kwargs.
+            # Hashable arguments (the common case) are keyed by their repr;
+            # anything else falls back to canonical JSON so dict ordering
+            # doesn't produce distinct keys.
+            params = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(params)
+                cache_key = f"{key_prefix or f.__name__}:{params!r}"
+            except TypeError:
+                cache_key = f"{key_prefix or f.__name__}:{json.dumps([args, kwargs], sort_keys=True, default=str)}"
 
             # Try to get from cache
             result = cache.get(cache_key)
@@ -103,8 +219,14 @@ def cached(timeout=300, key_prefix=''):
     return decorator
 
 
-def cache_bust(key_pattern=''):
-    """Decorator for clearing cache on function call"""
+def cache_bust(key_pattern='', key_prefix=''):
+    """
+    Decorator for clearing cache on function call.
+
+    key_prefix clears the entries of a cached(key_prefix=...) function via
+    the prefix index; key_pattern clears every key containing the pattern
+    (a full scan). With neither, the whole cache is cleared.
+    """
 
     def decorator(f: Callable) -> Callable:
         @wraps(f)
@@ -113,10 +235,10 @@ def cache_bust(key_pattern=''):
 
             # Clear cache entries matching pattern
             cache = get_cache()
-            if key_pattern:
-                keys_to_delete = [k for k in cache.cache.keys() if key_pattern in k]
-                for key in keys_to_delete:
-                    cache.delete(key)
+            if key_prefix:
+                cache.delete_prefix(key_prefix)
+            elif key_pattern:
+                cache.delete_matching(key_pattern)
             else:
                 cache.clear()
 
@@ -128,48 +250,63 @@ def cache_bust(key_pattern=''):
 
 
 class CacheStats:
-    """Track cache statistics and hit rates"""
+    """
+    Track cache statistics and hit rates.
+
+    The counters themselves are unlocked; SimpleCache calls record_hit()
+    and record_miss() while holding its own lock.
+    """
 
     def __init__(self):
         self.hits = 0
         self.misses = 0
-        self.total_calls = 0
+
+    @property
+    def total_calls(self) -> int:
+        """Total number of recorded lookups"""
+        return self.hits + self.misses
 
     def record_hit(self):
         """Record a cache hit"""
         self.hits += 1
-        self.total_calls += 1
 
     def record_miss(self):
         """Record a cache miss"""
         self.misses += 1
-        self.total_calls += 1
 
     def get_hit_rate(self) -> float:
         """Get cache hit rate as percentage"""
-        if self.total_calls == 0:
-            return 0.0
-        return (self.hits / self.total_calls) * 100
+        return self.get_stats()['hit_rate']
 
     def get_stats(self) -> dict:
         """Get statistics"""
+        hits, misses = self.hits, self.misses
+        total_calls = hits + misses
         return {
-            'hits': self.hits,
-            'misses': self.misses,
-            'total_calls': self.total_calls,
-            'hit_rate': self.get_hit_rate()
+            'hits': hits,
+            'misses': misses,
+            'total_calls': total_calls,
+            'hit_rate': (hits / total_calls) * 100 if total_calls else 0.0
         }
 
     def reset(self):
         """Reset statistics"""
         self.hits = 0
         self.misses = 0
-        self.total_calls = 0
 
 
 # Global stats instance
 _stats = CacheStats()
 
+# Global cache instance, created at import so lookups need no locking.
+# Entry lifetimes are set per call (set(timeout=...), cached(timeout=...)).
+_cache = SimpleCache(default_timeout=300, stats=_stats)
+
+
+def get_cache() -> SimpleCache:
+    """Get the global cache instance"""
+    return _cache
+
 
 def get_cache_stats():
     """Get global cache statistics"""
@@ -2,16 +2,38 @@
 Error handling and logging utilities
 """
 
+import atexit
 import logging
-import traceback
-from functools import wraps
+import logging.handlers
+import queue
+from functools import lru_cache, wraps
 from flask import jsonify, request
 from datetime import datetime
 import os
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the message and traceback on the calling
+    thread so records can cross a process boundary. The queue here is only
+    read by the in-process QueueListener, so the listener's handlers can do
+    that formatting instead, off the request thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 class AppLogger:
-    """Centralized logging configuration"""
+    """
+    Centralized logging configuration.
+
+    Records are handed to a QueueHandler, and a QueueListener thread
+    writes them to the file and console handlers. Request threads don't
+    wait on log file I/O or the handlers' locks.
+    """
 
     _instance = None
 
@@ -50,14 +72,32 @@ class AppLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        log_queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+        self.logger.addHandler(_InProcessQueueHandler(log_queue))
 
     def get_logger(self):
         """Get the logger instance"""
         return self.logger
 
 
+@lru_cache(maxsize=None)
+def _get_logger():
+    """
+    Get the shared 'app' logger for the decorators below.
+
+    Configured on first use rather than at import, so importing this module
+    (tests, scripts, migrations) doesn't create logs/app.log or start the
+    listener thread. Cached so requests skip the AppLogger singleton lookup.
+    """
+    return AppLogger().get_logger()
+
+
 class APIError(Exception):
     """Base API error"""
 
@@ -104,22 +144,20 @@ def handle_api_errors(f):
         try:
             return f(*args, **kwargs)
         except APIError as e:
-            logger = AppLogger().get_logger()
-            logger.warning(f"API Error: {e.message}")
+            _get_logger().warning(f"API Error: {e.message}")
             return jsonify(e.to_dict()), e.status_code
         except FileNotFoundError as e:
-            logger = AppLogger().get_logger()
-            logger.warning(f"File not found: {str(e)}")
+            _get_logger().warning(f"File not found: {str(e)}")
             error = NotFoundError(str(e))
             return jsonify(error.to_dict()), error.status_code
         except ValueError as e:
-            logger = AppLogger().get_logger()
-            logger.warning(f"Validation error: {str(e)}")
+            _get_logger().warning(f"Validation error: {str(e)}")
             error = ValidationError(str(e))
             return jsonify(error.to_dict()), error.status_code
         except Exception as e:
-            logger = AppLogger().get_logger()
-            logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+            # The traceback is formatted by the listener thread's handlers
+            # (see _InProcessQueueHandler), not on the request thread
+            _get_logger().error("Unexpected error: %s", e, exc_info=True)
             error = ServerError("An unexpected error occurred")
             return jsonify(error.to_dict()), 500
 
@@ -131,8 +169,7 @@ def log_request(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        logger = AppLogger().get_logger()
-        logger.info(
+        _get_logger().info(
             f"{request.method} {request.path} - "
             f"IP: {request.remote_addr} - "
             f"User-Agent: {request.user_agent}"
@@ -4,8 +4,112 @@ File utilities for handling markdown files and project data
 
 import os
 import re
+import threading
 import markdown
+from collections import Counter, OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+# YAML front matter sits between an opening '---' line and a closing one
+_FRONT_MATTER_OPEN = '---\n'
+_FRONT_MATTER_CLOSE = '\n---\n'
+
+# One Markdown instance, with its extensions and patterns set up once and
+# reused for every post. Markdown objects hold per-document state, so
+# conversions are serialized and the instance is reset before each one.
+_MARKDOWN = markdown.Markdown(extensions=['tables', 'codehilite'])
+_MARKDOWN_LOCK = threading.Lock()
+
+
+# Parsed blog posts, project file contents and generated virtual pages,
+# most recently used last
+_FILE_CACHE_MAX_ENTRIES = 256
+_file_cache = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def _render_markdown(text):
+    """Convert markdown text to HTML with the shared converter"""
+    with _MARKDOWN_LOCK:
+        return _MARKDOWN.reset().convert(text)
+
+
+def _read_text(filepath):
+    """Read a UTF-8 text file, with universal newlines"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=64)
+def _real_project_path(project_root, project_name):
+    """Resolve a project directory once rather than on every file request"""
+    return os.path.realpath(os.path.join(project_root, project_name))
+
+
+def _iter_markdown_files(top, prefix=''):
+    """
+    Yield the paths of .md files under top, relative to it, in os.walk order.
+
+    Uses the file type cached on each scandir entry rather than os.walk
+    plus os.path.relpath, so listing a file needs no extra stat call or
+    path normalization. Like os.walk, symlinked directories are not
+    followed and unreadable directories are skipped.
+    """
+    try:
+        scanner = os.scandir(top)
+    except OSError:
+        return
+
+    subdirs = []
+    with scanner:
+        for entry in scanner:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+            elif entry.name.endswith('.md'):
+                yield prefix + entry.name
+
+    for entry in subdirs:
+        yield from _iter_markdown_files(entry.path, f'{prefix}{entry.name}{os.sep}')
+
+
+def _cached_by_stamp(key, stamp, load):
+    """
+    Return load(), reusing the result cached under key while stamp is unchanged.
+
+    Results are shared between callers and must not be modified.
+    """
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _file_cache.move_to_end(key)
+            return entry[1]
+
+    result = load()
+
+    with _file_cache_lock:
+        _file_cache[key] = (stamp, result)
+        _file_cache.move_to_end(key)
+        if len(_file_cache) > _FILE_CACHE_MAX_ENTRIES:
+            _file_cache.popitem(last=False)
+    return result
+
+
+def _cached_by_mtime(kind, filepath, load):
+    """
+    Return load(filepath), reusing the previous result while the file is unchanged.
+
+    Entries are keyed by (kind, filepath) and checked against the file's
+    mtime and size, so an edited file is loaded again on the next call.
+    Results are shared between callers and must not be modified.
+    """
+    st = os.stat(filepath)
+    return _cached_by_stamp((kind, filepath), (st.st_mtime_ns, st.st_size), lambda: load(filepath))
 
 
 class BlogPostParser:
@@ -16,24 +120,36 @@ class BlogPostParser:
         """
         Parse a blog post markdown file with YAML front matter.
 
+        The result is cached until the file changes; treat it as read-only.
+
         Returns:
             dict: Parsed post data with metadata and HTML content
         """
-        with open(filepath, 'r') as f:
-            content = f.read()
+        return _cached_by_mtime('post', filepath, BlogPostParser._parse_file)
+
+    @staticmethod
+    def _parse_file(filepath):
+        """Read and parse a blog post file (uncached)"""
+        content = _read_text(filepath)
 
-        # Extract YAML front matter
-        match = re.match(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL)
-        if not match:
+        # Extract YAML front matter. Text mode already turns '\r\n' into
+        # '\n', so plain substring search finds both fences.
+        if not content.startswith(_FRONT_MATTER_OPEN):
+            return None
+        start = len(_FRONT_MATTER_OPEN)
+        end = content.find(_FRONT_MATTER_CLOSE, start)
+        if end == -1:
             return None
 
-        metadata_str, body = match.groups()
+        metadata_str = content[start:end]
+        body = content[end + len(_FRONT_MATTER_CLOSE):]
         metadata = BlogPostParser._parse_metadata(metadata_str)
+        body = body.strip()
 
         return {
             'metadata': metadata,
-            'content': body.strip(),
-            'html': markdown.markdown(body.strip(), extensions=['tables', 'codehilite'])
+            'content': body,
+            'html': _render_markdown(body)
         }
 
     @staticmethod
@@ -77,6 +193,15 @@ class ProjectFileManager:
         ]
     }
 
+    # Content generator method for each virtual page
+    VIRTUAL_PAGE_GENERATORS = {
+        'data/health-metrics-log.md': '_generate_health_metrics_log',
+        'data/workout-log.md': '_generate_workout_log',
+        'data/meal-log.md': '_generate_meal_log',
+        'data/progress-photos.md': '_generate_progress_photos',
+        'data/coaching-sessions.md': '_generate_coaching_sessions',
+    }
+
     def __init__(self, project_root, project_dirs, allow_data_access=False):
         self.project_root = project_root
         self.project_dirs = project_dirs
@@ -97,13 +222,7 @@ class ProjectFileManager:
             raise ValueError(f"Project '{project_name}' not found")
 
         project_path = os.path.join(self.project_root, project_name)
-        markdown_files = []
-
-        for root, _, files in os.walk(project_path):
-            for file in files:
-                if file.endswith('.md'):
-                    relative_path = os.path.relpath(os.path.join(root, file), project_path)
-                    markdown_files.append(relative_path)
+        markdown_files = list(_iter_markdown_files(project_path))
 
         # Add virtual database-driven pages if data access is allowed
         if self.allow_data_access and project_name in self.VIRTUAL_PAGES:
@@ -111,9 +230,10 @@ class ProjectFileManager:
 
         # Apply custom ordering if provided
         if file_order:
-            markdown_files.sort(key=lambda f: (
-                file_order.index(f) if f in file_order else len(file_order)
-            ))
+            # Rank each name by its first position, as file_order.index() would
+            rank = {name: i for i, name in reversed(list(enumerate(file_order)))}
+            unranked = len(file_order)
+            markdown_files.sort(key=lambda f: rank.get(f, unranked))
 
         return markdown_files
 
@@ -137,7 +257,11 @@ class ProjectFileManager:
             file_path in self.VIRTUAL_PAGES[project_name]):
             return self._generate_virtual_page_content(project_name, file_path)
 
-        project_path = os.path.realpath(os.path.join(self.project_root, project_name))
+        # Only markdown files are served; reject anything else before any stat
+        if not file_path.endswith('.md'):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        project_path = _real_project_path(self.project_root, project_name)
 
         # Build search paths based on allow_data_access flag
         search_paths = [os.path.join(project_path, 'docs')]
@@ -148,22 +272,26 @@ class ProjectFileManager:
         search_paths.append(project_path)  # Fallback to project root for backwards compatibility
 
         real_path = None
+        project_prefix = project_path + os.sep
 
         for search_path in search_paths:
-            candidate_path = os.path.join(search_path, file_path)
-            candidate_real_path = os.path.realpath(candidate_path)
+            # Security check: ensure the path is within the project directory.
+            # normpath and isfile rule out most candidates cheaply; realpath
+            # (one lstat per component) only runs on a file that exists, to
+            # catch symlinks pointing outside the project.
+            candidate_path = os.path.normpath(os.path.join(search_path, file_path))
+            if not candidate_path.startswith(project_prefix) or not os.path.isfile(candidate_path):
+                continue
 
-            # Security check: ensure the path is within the project directory
-            if candidate_real_path.startswith(project_path) and os.path.exists(candidate_real_path):
-                if candidate_real_path.endswith('.md'):
-                    real_path = candidate_real_path
-                    break
+            candidate_real_path = os.path.realpath(candidate_path)
+            if candidate_real_path.startswith(project_prefix) and candidate_real_path.endswith('.md'):
+                real_path = candidate_real_path
+                break
 
         if not real_path:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(real_path, 'r') as f:
-            return f.read()
+        return _cached_by_mtime('text', real_path, _read_text)
 
     def _generate_virtual_page_content(self, project_name, file_path):
         """
@@ -176,26 +304,53 @@ class ProjectFileManager:
         Returns:
             str: Generated markdown content from database
         """
+        from flask_login import current_user
+
+        generator_name = self.VIRTUAL_PAGE_GENERATORS.get(file_path)
+        if generator_name is None:
+            raise FileNotFoundError(f"Unknown virtual page: {file_path}")
+        generate = getattr(self, generator_name)
+
+        if not current_user.is_authenticated:
+            return generate()
+
+        # Reuse the page until the user's rows behind it change
+        user_id = current_user.id
+        version = self._virtual_page_version(file_path, user_id)
+        return _cached_by_stamp(('virtual', file_path, user_id), version, generate)
+
+    @staticmethod
+    def _virtual_page_version(file_path, user_id):
+        """
+        Get a stamp that changes whenever the rows behind a virtual page do.
+
+        For each table the page reads, this is the user's row count (which
+        catches deletes) and latest updated_at (which catches inserts and
+        edits), fetched with one aggregate query per table.
+        """
+        from sqlalchemy import func
         from ..models.health import HealthMetric
-        from ..models.workout import WorkoutSession
+        from ..models.workout import ExerciseLog, WorkoutSession
         from ..models.nutrition import MealLog
         from ..models.coaching import CoachingSession, ProgressPhoto
-        from flask import current_app
-        from flask_login import current_user
 
-        # Map virtual pages to content generators
-        if file_path == 'data/health-metrics-log.md':
-            return self._generate_health_metrics_log()
-        elif file_path == 'data/workout-log.md':
-            return self._generate_workout_log()
-        elif file_path == 'data/meal-log.md':
-            return self._generate_meal_log()
-        elif file_path == 'data/progress-photos.md':
-            return self._generate_progress_photos()
-        elif file_path == 'data/coaching-sessions.md':
-            return self._generate_coaching_sessions()
-        else:
-            raise FileNotFoundError(f"Unknown virtual page: {file_path}")
+        sources = {
+            'data/health-metrics-log.md': (HealthMetric,),
+            'data/workout-log.md': (WorkoutSession, ExerciseLog),
+            'data/meal-log.md': (MealLog,),
+            'data/progress-photos.md': (ProgressPhoto,),
+            'data/coaching-sessions.md': (CoachingSession,),
+        }
+
+        version = []
+        for model in sources[file_path]:
+            query = model.query.with_entities(func.count(model.id), func.max(model.updated_at))
+            if model is ExerciseLog:
+                query = query.join(ExerciseLog.workout_session).filter(WorkoutSession.user_id == user_id)
+            else:
+                query = query.filter(model.user_id == user_id)
+            version.extend(query.one())
+        return tuple(version)
 
     def _generate_health_metrics_log(self):
         """Generate health metrics log from database"""
@@ -207,64 +362,71 @@ class ProjectFileManager:
 
         metrics = HealthMetric.query.filter_by(user_id=current_user.id).order_by(HealthMetric.recorded_date.desc()).all()
 
-        content = "# Health Metrics Log\n\n"
-        content += "Track your weight, body fat percentage, and other health metrics over time.\n\n"
+        content = [
+            "# Health Metrics Log\n\n",
+            "Track your weight, body fat percentage, and other health metrics over time.\n\n",
+        ]
 
         if not metrics:
-            content += "*No health metrics recorded yet.*\n"
-            return content
+            content.append("*No health metrics recorded yet.*\n")
+            return ''.join(content)
 
-        content += "| Date | Weight (lbs) | Body Fat % | BMI | Notes |\n"
-        content += "|------|--------------|------------|-----|-------|\n"
+        content.append("| Date | Weight (lbs) | Body Fat % | BMI | Notes |\n")
+        content.append("|------|--------------|------------|-----|-------|\n")
 
         for metric in metrics:
-            date = metric.recorded_date.strftime('%Y-%m-%d')
+            date = metric.recorded_date.isoformat()
             weight = f"{metric.weight_lbs:.1f}" if metric.weight_lbs else "—"
             bodyfat = f"{metric.body_fat_percentage:.1f}" if metric.body_fat_percentage else "—"
             bmi = f"{metric.bmi:.1f}" if metric.bmi else "—"
             notes = metric.notes or ""
-            content += f"| {date} | {weight} | {bodyfat} | {bmi} | {notes} |\n"
+            content.append(f"| {date} | {weight} | {bodyfat} | {bmi} | {notes} |\n")
 
-        return content
+        return ''.join(content)
 
     def _generate_workout_log(self):
         """Generate workout log from database"""
         from ..models.workout import WorkoutSession
         from flask_login import current_user
+        from sqlalchemy.orm import selectinload
 
         if not current_user.is_authenticated:
             return "# Workout Log\n\n*Please log in to view your workout history.*"
 
-        workouts = WorkoutSession.query.filter_by(user_id=current_user.id).order_by(WorkoutSession.session_date.desc()).limit(50).all()
+        # Load every listed session's exercises in one extra query rather
+        # than one lazy load per session
+        workouts = WorkoutSession.query.options(selectinload(WorkoutSession.exercise_logs)).filter_by(user_id=current_user.id).order_by(WorkoutSession.session_date.desc()).limit(50).all()
 
-        content = "# Workout Log\n\n"
-        content += "Recent workout sessions and exercise tracking.\n\n"
+        content = [
+            "# Workout Log\n\n",
+            "Recent workout sessions and exercise tracking.\n\n",
+        ]
 
         if not workouts:
-            content += "*No workouts recorded yet.*\n"
-            return content
+            content.append("*No workouts recorded yet.*\n")
+            return ''.join(content)
 
         for workout in workouts:
-            date = workout.session_date.strftime('%Y-%m-%d')
-            content += f"\n## {date} - {workout.session_type.value.replace('_', ' ').title()}\n\n"
+            date = workout.session_date.isoformat()
+            content.append(f"\n## {date} - {workout.session_type.value.replace('_', ' ').title()}\n\n")
             if workout.duration_minutes:
-                content += f"**Duration:** {workout.duration_minutes} minutes\n\n"
+                content.append(f"**Duration:** {workout.duration_minutes} minutes\n\n")
             if workout.notes:
-                content += f"{workout.notes}\n\n"
+                content.append(f"{workout.notes}\n\n")
 
             if workout.exercise_logs:
-                content += "### Exercises\n\n"
+                content.append("### Exercises\n\n")
                 for exercise in workout.exercise_logs:
-                    content += f"- **{exercise.exercise_name}**"
+                    content.append(f"- **{exercise.exercise_name}**")
                     if exercise.sets and exercise.reps:
-                        content += f": {exercise.sets} sets × {exercise.reps} reps"
+                        content.append(f": {exercise.sets} sets × {exercise.reps} reps")
                     if exercise.weight_lbs:
-                        content += f" @ {exercise.weight_lbs} lbs"
+                        content.append(f" @ {exercise.weight_lbs} lbs")
                     if exercise.notes:
-                        content += f" ({exercise.notes})"
-                    content += "\n"
+                        content.append(f" ({exercise.notes})")
+                    content.append("\n")
 
-        return content
+        return ''.join(content)
 
     def _generate_meal_log(self):
         """Generate meal log from database"""
@@ -276,37 +438,38 @@ class ProjectFileManager:
 
         meals = MealLog.query.filter_by(user_id=current_user.id).order_by(MealLog.meal_date.desc()).limit(30).all()
 
-        content = "# Meal Log\n\n"
-        content += "Daily nutrition tracking and meal records.\n\n"
+        content = [
+            "# Meal Log\n\n",
+            "Daily nutrition tracking and meal records.\n\n",
+        ]
 
         if not meals:
-            content += "*No meals recorded yet.*\n"
-            return content
+            content.append("*No meals recorded yet.*\n")
+            return ''.join(content)
 
         current_date = None
         for meal in meals:
-            date = meal.meal_date.strftime('%Y-%m-%d')
+            date = meal.meal_date.isoformat()
             if date != current_date:
-                content += f"\n## {date}\n\n"
+                content.append(f"\n## {date}\n\n")
                 current_date = date
 
-            content += f"### {meal.meal_type.value.title()}\n\n"
+            content.append(f"### {meal.meal_type.value.title()}\n\n")
             if meal.description:
-                content += f"{meal.description}\n\n"
+                content.append(f"{meal.description}\n\n")
             if meal.calories or meal.protein_g or meal.carbs_g or meal.fat_g:
-                content += "**Macros:** "
-                parts = []
+                macros = []
                 if meal.calories:
-                    parts.append(f"{meal.calories} cal")
+                    macros.append(f"{meal.calories} cal")
                 if meal.protein_g:
-                    parts.append(f"{meal.protein_g}g protein")
+                    macros.append(f"{meal.protein_g}g protein")
                 if meal.carbs_g:
-                    parts.append(f"{meal.carbs_g}g carbs")
+                    macros.append(f"{meal.carbs_g}g carbs")
                 if meal.fat_g:
-                    parts.append(f"{meal.fat_g}g fat")
-                content += " | ".join(parts) + "\n\n"
+                    macros.append(f"{meal.fat_g}g fat")
+                content.append("**Macros:** " + " | ".join(macros) + "\n\n")
 
-        return content
+        return ''.join(content)
 
     def _generate_progress_photos(self):
         """Generate progress photos page from database"""
@@ -318,23 +481,25 @@ class ProjectFileManager:
 
         photos = ProgressPhoto.query.filter_by(user_id=current_user.id).order_by(ProgressPhoto.photo_date.desc()).all()
 
-        content = "# Progress Photos\n\n"
-        content += "Visual tracking of your transformation journey.\n\n"
+        content = [
+            "# Progress Photos\n\n",
+            "Visual tracking of your transformation journey.\n\n",
+        ]
 
         if not photos:
-            content += "*No progress photos uploaded yet.*\n"
-            return content
+            content.append("*No progress photos uploaded yet.*\n")
+            return ''.join(content)
 
         for photo in photos:
-            date = photo.photo_date.strftime('%Y-%m-%d')
-            content += f"## {date}\n\n"
+            date = photo.photo_date.isoformat()
+            content.append(f"## {date}\n\n")
             if photo.photo_url:
-                content += f"![Progress Photo]({photo.photo_url})\n\n"
+                content.append(f"![Progress Photo]({photo.photo_url})\n\n")
             if photo.notes:
-                content += f"{photo.notes}\n\n"
-            content += "---\n\n"
+                content.append(f"{photo.notes}\n\n")
+            content.append("---\n\n")
 
-        return content
+        return ''.join(content)
 
     def _generate_coaching_sessions(self):
         """Generate coaching sessions log from database"""
@@ -346,28 +511,30 @@ class ProjectFileManager:
 
         sessions = CoachingSession.query.filter_by(user_id=current_user.id).order_by(CoachingSession.session_date.desc()).all()
 
-        content = "# Coaching Sessions\n\n"
-        content += "Record of coaching feedback, plans, and progress discussions.\n\n"
+        content = [
+            "# Coaching Sessions\n\n",
+            "Record of coaching feedback, plans, and progress discussions.\n\n",
+        ]
 
         if not sessions:
-            content += "*No coaching sessions recorded yet.*\n"
-            return content
+            content.append("*No coaching sessions recorded yet.*\n")
+            return ''.join(content)
 
         for session in sessions:
-            date = session.session_date.strftime('%Y-%m-%d')
-            content += f"\n## {date}\n\n"
+            date = session.session_date.isoformat()
+            content.append(f"\n## {date}\n\n")
             if session.discussion_notes:
-                content += f"### Discussion\n\n{session.discussion_notes}\n\n"
+                content.append(f"### Discussion\n\n{session.discussion_notes}\n\n")
             if session.coach_feedback:
-                content += f"### Coach Feedback\n\n{session.coach_feedback}\n\n"
+                content.append(f"### Coach Feedback\n\n{session.coach_feedback}\n\n")
             if session.action_items:
-                content += "### Action Items\n\n"
+                content.append("### Action Items\n\n")
                 for item in session.action_items:
-                    content += f"- {item}\n"
-                content += "\n"
-            content += "---\n\n"
+                    content.append(f"- {item}\n")
+                content.append("\n")
+            content.append("---\n\n")
 
-        return content
+        return ''.join(content)
 
     def get_gemini_file(self, project_name):
         """Get GEMINI.md file content for a project"""
@@ -379,8 +546,31 @@ class ProjectFileManager:
         if not os.path.exists(gemini_path):
             raise FileNotFoundError(f"GEMINI.md not found for {project_name}")
 
-        with open(gemini_path, 'r') as f:
-            return f.read()
+        return _cached_by_mtime('text', gemini_path, _read_text)
+
+
+def _keyword_index(category_keywords):
+    """
+    Build one regex over every category keyword, plus what each match counts for.
+
+    The alternation sits in a lookahead, so one findall() pass reports a
+    match at every position where some keyword starts, overlapping ones
+    included. Longer keywords are tried first; the returned hits map each
+    keyword to the (category, keyword) pairs it stands for, which also
+    covers any shorter keyword it starts with (e.g. 'progressive' also
+    counts as 'progress').
+    """
+    keywords = sorted({kw for kws in category_keywords.values() for kw in kws}, key=len, reverse=True)
+    pattern = re.compile('(?=({}))'.format('|'.join(re.escape(kw) for kw in keywords)))
+    hits = {
+        keyword: tuple(
+            (category, kw)
+            for category, kws in category_keywords.items()
+            for kw in kws if keyword.startswith(kw)
+        )
+        for keyword in keywords
+    }
+    return pattern, hits
 
 
 class FileCategorizer:
@@ -420,6 +610,10 @@ class FileCategorizer:
         ]
     }
 
+    # All keywords in one compiled pattern, so a filename or content
+    # excerpt is matched against every category in a single scan
+    KEYWORD_PATTERN, KEYWORD_HITS = _keyword_index(CATEGORY_KEYWORDS)
+
     # Default categories for each project type
     PROJECT_CATEGORY_ORDER = {
         'Health_and_Fitness': ['training', 'nutrition', 'tracking', 'coaching', 'reference'],
@@ -441,26 +635,70 @@ class FileCategorizer:
         filename_lower = filename.lower()
 
         # Check filename first
-        for category, keywords in cls.CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in filename_lower:
-                    return category
+        matched = {
+            category
+            for keyword in cls.KEYWORD_PATTERN.findall(filename_lower)
+            for category, _ in cls.KEYWORD_HITS[keyword]
+        }
+        for category in cls.CATEGORY_KEYWORDS:
+            if category in matched:
+                return category
 
         # If content provided, analyze it
         if content:
             content_lower = content[:2000].lower()  # Only check first 2000 chars
-            category_scores = {}
 
-            for category, keywords in cls.CATEGORY_KEYWORDS.items():
-                score = sum(1 for kw in keywords if kw in content_lower)
-                if score > 0:
-                    category_scores[category] = score
+            # Score each category by the number of distinct keywords present
+            found = {
+                hit
+                for keyword in cls.KEYWORD_PATTERN.findall(content_lower)
+                for hit in cls.KEYWORD_HITS[keyword]
+            }
+            category_scores = Counter(category for category, _ in found)
 
             if category_scores:
-                return max(category_scores, key=category_scores.get)
+                # Ties go to the category listed first, as before
+                return max(
+                    (category for category in cls.CATEGORY_KEYWORDS if category in category_scores),
+                    key=category_scores.get
+                )
 
         return 'general'
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_file_cached(cls, filename, content):
+        """
+        categorize_file() memoized on the filename and excerpt.
+
+        Project pages re-send the same unchanged excerpts on every render;
+        hashing an excerpt is far cheaper than scanning it for keywords.
+        """
+        return cls.categorize_file(filename, content)
+
+    @staticmethod
+    def read_excerpts(root, relative_paths, size=2000):
+        """
+        Read the start of each file for categorize_project_files().
+
+        Args:
+            root: Directory the paths are relative to
+            relative_paths: Paths of the files to read
+            size: Number of characters to read from each file
+
+        Returns:
+            list: Tuples (relative_path, excerpt) in input order, with an
+            empty excerpt for files that can't be read
+        """
+        excerpts = []
+        for relative_path in relative_paths:
+            try:
+                with open(os.path.join(root, relative_path), 'r', encoding='utf-8') as f:
+                    excerpts.append((relative_path, f.read(size)))
+            except Exception:
+                excerpts.append((relative_path, ''))
+        return excerpts
+
     @classmethod
     def categorize_project_files(cls, project_name, files_with_content):
         """
@@ -476,24 +714,22 @@ class FileCategorizer:
         categorized = {}
 
         for filename, content in files_with_content:
-            category = cls.categorize_file(filename, content)
+            category = cls._categorize_file_cached(filename, content)
             if category not in categorized:
                 categorized[category] = []
             categorized[category].append(filename)
 
-        # Sort categories based on project preference
+        # Sort categories based on project preference: preferred categories
+        # first in their listed order, then the rest alphabetically
         category_order = cls.PROJECT_CATEGORY_ORDER.get(project_name, [])
-        sorted_categories = {}
+        rank = {cat: i for i, cat in enumerate(category_order)}
+        unranked = len(category_order)
 
-        # Add categories in preferred order first
-        for cat in category_order:
-            if cat in categorized:
-                sorted_categories[cat] = sorted(categorized[cat])
-
-        # Add remaining categories
-        for cat in sorted(categorized.keys()):
-            if cat not in sorted_categories:
-                sorted_categories[cat] = sorted(categorized[cat])
+        sorted_categories = {}
+        for cat in sorted(categorized, key=lambda c: (rank.get(c, unranked), c)):
+            files = categorized[cat]
+            files.sort()
+            sorted_categories[cat] = files
 
         return sorted_categories
 
@@ -530,26 +766,26 @@ class HealthDataParser:
         weight_data = []
         bodyfat_data = []
 
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-            # Skip header and separator
-            for line in lines[2:]:
-                parts = [p.strip() for p in line.split('|') if p.strip()]
+        add_weight = weight_data.append
+        add_bodyfat = bodyfat_data.append
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            # Read line by line rather than loading the whole log, skipping
+            # the header and separator
+            for line in islice(f, 2, None):
+                parts = [p for p in map(str.strip, line.split('|')) if p]
                 if len(parts) >= 3:
-                    date = parts[0]
-                    weight = parts[1]
-                    bodyfat = parts[2]
-
-                    if weight != 'None':
-                        try:
-                            weight_data.append({'x': date, 'y': float(weight)})
-                        except ValueError:
-                            pass
-
-                    if bodyfat != 'None':
-                        try:
-                            bodyfat_data.append({'x': date, 'y': float(bodyfat)})
-                        except ValueError:
-                            pass
+                    date, weight, bodyfat = parts[:3]
+
+                    # Missing values ('None') fail float() like any other text
+                    try:
+                        add_weight({'x': date, 'y': float(weight)})
+                    except ValueError:
+                        pass
+
+                    try:
+                        add_bodyfat({'x': date, 'y': float(bodyfat)})
+                    except ValueError:
+                        pass
 
         return {'weight': weight_data, 'bodyfat': bodyfat_data}
@@ -0,0 +1,39 @@
+"""
+Lazy package attributes (PEP 562)
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package: str, namespace: dict, attrs: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Build module-level __getattr__ and __dir__ functions for a package.
+
+    Each public name in attrs is imported from its submodule on first
+    access and stored in the package namespace, so later lookups are plain
+    attribute reads and importing the package doesn't load every submodule.
+
+    Args:
+        package: The package's __name__
+        namespace: The package's globals()
+        attrs: Public name -> submodule (relative to package) that defines it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package
+    """
+
+    def __getattr__(name: str):
+        """Import the submodule defining name on first access and cache the attribute."""
+        try:
+            module_name = attrs[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(f'.{module_name}', package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get('__all__', ())))
+
+    return __getattr__, __dir__
@@ -25,11 +25,8 @@ class Paginator(Generic[T]):
         self.per_page = max(1, per_page)  # Ensure at least 1
         self.page = max(1, page)  # Ensure at least page 1
         self.total = len(items)
-
-    @property
-    def pages(self) -> int:
-        """Get total number of pages"""
-        return ceil(self.total / self.per_page)
+        # Total number of pages, fixed by total and per_page so computed once
+        self.pages = ceil(self.total / self.per_page)
 
     @property
     def has_prev(self) -> bool:
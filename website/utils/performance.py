@@ -2,68 +2,86 @@
 Performance monitoring and metrics
 """
 
+import heapq
 import time
 import psutil
 import os
-from collections import deque
+import threading
+from collections import defaultdict, deque
 from functools import wraps
+from itertools import islice
 from typing import Callable, Dict, Any, List
 from datetime import datetime
 
 
+class EndpointStats:
+    """Running request count and timings for one endpoint"""
+
+    __slots__ = ('count', 'total_time', 'min_time', 'max_time')
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+
+
 class PerformanceMonitor:
     """Monitor application performance metrics"""
 
     def __init__(self):
-        self.request_times = deque(maxlen=1000)  # Auto-pops oldest when full
-        self.endpoint_times = {}
+        # (timestamp, duration, endpoint) per request; auto-pops oldest when full
+        self.request_times = deque(maxlen=1000)
+        self._request_time_total = 0.0  # Sum of the durations in request_times
+        # Keeps request_times and its running total in step across request threads
+        self._request_times_lock = threading.Lock()
+        self.endpoint_times = defaultdict(EndpointStats)
         self.memory_snapshots = []
         self.start_time = time.time()
+        self._process = psutil.Process(os.getpid())
+        # Start the CPU sample window; later get_cpu_usage() calls measure
+        # from the previous call without sleeping
+        psutil.cpu_percent(interval=None)
 
     def record_request(self, endpoint: str, duration: float) -> None:
         """Record request duration"""
-        self.request_times.append({
-            'timestamp': datetime.now().isoformat(),
-            'duration': duration,
-            'endpoint': endpoint
-        })
-        # deque with maxlen automatically pops oldest when full
+        # Formatting is left to get_recent_requests(), off the request path
+        entry = (time.time(), duration, endpoint)
+        with self._request_times_lock:
+            if len(self.request_times) == self.request_times.maxlen:
+                self._request_time_total -= self.request_times[0][1]
+            self._request_time_total += duration
+            self.request_times.append(entry)
 
         # Track endpoint-specific metrics
-        if endpoint not in self.endpoint_times:
-            self.endpoint_times[endpoint] = {
-                'count': 0,
-                'total_time': 0,
-                'min_time': float('inf'),
-                'max_time': 0
-            }
-
-        metrics = self.endpoint_times[endpoint]
-        metrics['count'] += 1
-        metrics['total_time'] += duration
-        metrics['min_time'] = min(metrics['min_time'], duration)
-        metrics['max_time'] = max(metrics['max_time'], duration)
+        stats = self.endpoint_times[endpoint]
+        stats.count += 1
+        stats.total_time += duration
+        if duration < stats.min_time:
+            stats.min_time = duration
+        if duration > stats.max_time:
+            stats.max_time = duration
 
     def get_average_request_time(self) -> float:
         """Get average request time"""
-        if not self.request_times:
-            return 0
-        total = sum(r['duration'] for r in self.request_times)
-        return total / len(self.request_times)
+        with self._request_times_lock:
+            if not self.request_times:
+                return 0
+            return self._request_time_total / len(self.request_times)
 
     def get_endpoint_metrics(self, endpoint: str) -> Dict[str, Any]:
         """Get metrics for specific endpoint"""
         if endpoint not in self.endpoint_times:
             return None
 
-        metrics = self.endpoint_times[endpoint]
+        stats = self.endpoint_times[endpoint]
         return {
             'endpoint': endpoint,
-            'count': metrics['count'],
-            'total_time': metrics['total_time'],
-            'avg_time': metrics['total_time'] / metrics['count'],
-            'min_time': metrics['min_time'],
-            'max_time': metrics['max_time']
+            'count': stats.count,
+            'total_time': stats.total_time,
+            'avg_time': stats.total_time / stats.count,
+            'min_time': stats.min_time,
+            'max_time': stats.max_time
         }
 
     def get_slowest_endpoints(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -71,28 +89,28 @@ class PerformanceMonitor:
         endpoints = [
             {
                 'endpoint': endpoint,
-                'avg_time': metrics['total_time'] / metrics['count'],
-                'count': metrics['count']
+                'avg_time': stats.total_time / stats.count,
+                'count': stats.count
             }
-            for endpoint, metrics in self.endpoint_times.items()
+            for endpoint, stats in self.endpoint_times.items()
         ]
-        return sorted(endpoints, key=lambda x: x['avg_time'], reverse=True)[:limit]
+        return heapq.nlargest(limit, endpoints, key=lambda x: x['avg_time'])
 
     def get_most_called_endpoints(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most called endpoints"""
         endpoints = [
             {
                 'endpoint': endpoint,
-                'count': metrics['count'],
-                'avg_time': metrics['total_time'] / metrics['count']
+                'count': stats.count,
+                'avg_time': stats.total_time / stats.count
             }
-            for endpoint, metrics in self.endpoint_times.items()
+            for endpoint, stats in self.endpoint_times.items()
         ]
-        return sorted(endpoints, key=lambda x: x['count'], reverse=True)[:limit]
+        return heapq.nlargest(limit, endpoints, key=lambda x: x['count'])
 
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get current memory usage"""
-        process = psutil.Process(os.getpid())
+        process = self._process
         memory_info = process.memory_info()
 
         return {
@@ -102,8 +120,8 @@ class PerformanceMonitor:
         }
 
     def get_cpu_usage(self) -> float:
-        """Get current CPU usage"""
-        return psutil.cpu_percent(interval=0.1)
+        """Get CPU usage since the previous call, without blocking"""
+        return psutil.cpu_percent(interval=None)
 
     def get_uptime(self) -> Dict[str, Any]:
         """Get application uptime"""
@@ -129,13 +147,26 @@ class PerformanceMonitor:
             'unique_endpoints': len(self.endpoint_times)
         }
 
+    def get_recent_requests(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the most recent requests, oldest first"""
+        with self._request_times_lock:
+            recent = list(islice(self.request_times, max(0, len(self.request_times) - limit), None))
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                'duration': duration,
+                'endpoint': endpoint
+            }
+            for timestamp, duration, endpoint in recent
+        ]
+
     def get_full_report(self) -> Dict[str, Any]:
         """Get comprehensive performance report"""
         return {
             'system_metrics': self.get_system_metrics(),
             'slowest_endpoints': self.get_slowest_endpoints(),
             'most_called_endpoints': self.get_most_called_endpoints(),
-            'recent_requests': self.request_times[-20:]  # Last 20 requests
+            'recent_requests': self.get_recent_requests()
         }
 
 